@@ -21,12 +21,14 @@ Version: 1.0.0
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import hashlib
 import json
+import time
 
 
 class UpdatePriority(Enum):
@@ -62,7 +64,12 @@ class ChangeType(Enum):
     SECURITY = "security"
 
 
-@dataclass
+# Shared encoder for checksums. Its output is byte-identical to
+# json.dumps(..., sort_keys=True), so existing checksums stay valid.
+_CHECKSUM_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+@dataclass(frozen=True, slots=True)
 class AdapterConfig:
     """Configuration for a knowledge source adapter.
     
@@ -73,6 +80,8 @@ class AdapterConfig:
         rate_limit_rpm: Requests per minute limit
         timeout_seconds: Request timeout in seconds
         cache_ttl_hours: How long to cache responses
+        cache_max_entries: Most responses kept in cache before evicting the
+            least recently used
         trust_level: Default trust level for this source
         custom_settings: Additional adapter-specific settings
     """
@@ -82,11 +91,12 @@ class AdapterConfig:
     rate_limit_rpm: int = 60
     timeout_seconds: int = 30
     cache_ttl_hours: int = 24
+    cache_max_entries: int = 1024
     trust_level: TrustLevel = TrustLevel.COMMUNITY
     custom_settings: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UpdateSource:
     """Represents the source of a knowledge update.
     
@@ -111,7 +121,7 @@ class UpdateSource:
     raw_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KnowledgeChange:
     """Represents a single change to knowledge content.
     
@@ -135,7 +145,7 @@ class KnowledgeChange:
     related_skills: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KnowledgeUpdate:
     """Represents a proposed update to a knowledge file.
     
@@ -172,8 +182,9 @@ class KnowledgeUpdate:
     def __post_init__(self):
         """Calculate checksum if content provided."""
         if self.proposed_content and not self.checksum:
-            content_str = json.dumps(self.proposed_content, sort_keys=True)
-            self.checksum = hashlib.sha256(content_str.encode()).hexdigest()
+            content_str = _CHECKSUM_ENCODER.encode(self.proposed_content)
+            # Frozen dataclass: the derived field is set once, here
+            object.__setattr__(self, "checksum", hashlib.sha256(content_str.encode()).hexdigest())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization.
@@ -234,7 +245,8 @@ class BaseAdapter(ABC):
             config: Adapter configuration including credentials
         """
         self.config = config
-        self._cache: Dict[str, Any] = {}
+        # key -> (monotonic store time, data), least recently used first
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
         self._last_fetch: Optional[datetime] = None
     
     @property
@@ -348,17 +360,17 @@ class BaseAdapter(ABC):
         Returns:
             True if cache should be refreshed
         """
-        if cache_key not in self._cache:
-            return True
-        
-        cached = self._cache[cache_key]
-        if "timestamp" not in cached:
+        cached = self._cache.get(cache_key)
+        if cached is None:
             return True
         
-        cache_age = datetime.utcnow() - cached["timestamp"]
-        cache_ttl = self.config.cache_ttl_hours * 3600
+        cache_age = time.monotonic() - cached[0]
+        expired = cache_age > self.config.cache_ttl_hours * 3600
+        if expired:
+            # Drop stale entries as they are found so they don't hold memory
+            del self._cache[cache_key]
         
-        return cache_age.total_seconds() > cache_ttl
+        return expired
     
     def _get_cached(self, cache_key: str) -> Optional[Any]:
         """Get data from cache if valid.
@@ -371,7 +383,8 @@ class BaseAdapter(ABC):
         """
         if self._should_refresh_cache(cache_key):
             return None
-        return self._cache[cache_key].get("data")
+        self._cache.move_to_end(cache_key)
+        return self._cache[cache_key][1]
     
     def _set_cached(self, cache_key: str, data: Any) -> None:
         """Store data in cache.
@@ -380,10 +393,12 @@ class BaseAdapter(ABC):
             cache_key: Key for the cached data
             data: Data to cache
         """
-        self._cache[cache_key] = {
-            "data": data,
-            "timestamp": datetime.utcnow(),
-        }
+        self._cache[cache_key] = (time.monotonic(), data)
+        self._cache.move_to_end(cache_key)
+        
+        # Evict least recently used entries beyond the configured bound
+        while len(self._cache) > self.config.cache_max_entries:
+            self._cache.popitem(last=False)
     
     def __repr__(self) -> str:
         """String representation of the adapter."""
@@ -17,7 +17,7 @@ Author: Cursor Agent Factory
 Version: 1.0.0
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -112,8 +112,7 @@ class CommunityAdapter(BaseAdapter):
         Args:
             config: Adapter configuration
         """
-        super().__init__(config)
-        config.trust_level = TrustLevel.COMMUNITY  # Always community trust
+        super().__init__(replace(config, trust_level=TrustLevel.COMMUNITY))  # Always community trust
         self._session: Optional[aiohttp.ClientSession] = None
     
     @property
@@ -17,7 +17,7 @@ Author: Cursor Agent Factory
 Version: 1.0.0
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -82,8 +82,7 @@ class FeedbackAdapter(BaseAdapter):
             feedback_dir: Directory containing feedback files
             factory_root: Factory root directory
         """
-        super().__init__(config)
-        config.trust_level = TrustLevel.COMMUNITY  # Feedback is community level
+        super().__init__(replace(config, trust_level=TrustLevel.COMMUNITY))  # Feedback is community level
         
         if factory_root:
             self._factory_root = Path(factory_root)
@@ -18,15 +18,108 @@ Author: Cursor Agent Factory
 Version: 1.0.0
 """
 
+import hashlib
 import json
+import mmap
+import os
 import shutil
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
 
-@dataclass
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write data as compact JSON, using orjson when it is installed.
+    
+    Manifests are machine-read, so no indentation is written; use
+    ``python -m json.tool`` to inspect one by hand.
+    
+    Args:
+        path: Destination file.
+        data: JSON-serializable dictionary.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data))
+    else:
+        path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Read a JSON file, using orjson when it is installed.
+    
+    Args:
+        path: File to read.
+        
+    Returns:
+        Parsed JSON data.
+    """
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# Same digest as repo_analyzer.get_file_hash, so backup hashes can be
+# compared with the hashes used during merge. Kept fixed rather than
+# picking a faster optional hasher, which would make manifests differ
+# between installs.
+_HASH_ALGORITHM = "md5"
+
+
+def _hash_file(file_path: Path) -> str:
+    """Compute the MD5 hex digest of a file without a Python read loop.
+    
+    Args:
+        file_path: Path to the file to hash.
+        
+    Returns:
+        Hex digest of the file content.
+    """
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _HASH_ALGORITHM).hexdigest()
+        
+        digest = hashlib.new(_HASH_ALGORITHM)
+        if file_path.stat().st_size:  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        return digest.hexdigest()
+
+
+def _tree_size(root: Path) -> int:
+    """Sum the sizes of all files below a directory.
+    
+    Uses os.scandir so the type checks reuse the directory entry data
+    instead of issuing a stat call per path. Symlinked directories are
+    not followed.
+    
+    Args:
+        root: Directory to measure.
+        
+    Returns:
+        Total size in bytes.
+    """
+    total = 0
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+
+@dataclass(frozen=True, slots=True)
 class BackupEntry:
     """Record of a single backed up file.
     
@@ -36,15 +129,40 @@ class BackupEntry:
         file_hash: MD5 hash of the original content.
         backed_up_at: Timestamp when backup was created.
         was_new: Whether this was a new file (didn't exist before).
+        size: Size of the original file in bytes (0 if not recorded).
+        mtime_ns: Modification time of the original file (0 if not recorded).
     """
     original_path: str
     backup_path: str
     file_hash: str
     backed_up_at: str
     was_new: bool = False
+    size: int = 0
+    mtime_ns: int = 0
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BackupEntry':
+        """Create entry from dictionary.
+        
+        Args:
+            data: Dictionary representation.
+            
+        Returns:
+            BackupEntry instance.
+        """
+        get = data.get
+        return cls(
+            data["original_path"],
+            data["backup_path"],
+            data["file_hash"],
+            data["backed_up_at"],
+            get("was_new", False),
+            get("size", 0),
+            get("mtime_ns", 0),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupManifest:
     """Manifest for a backup session.
     
@@ -83,6 +201,8 @@ class BackupManifest:
                     "file_hash": e.file_hash,
                     "backed_up_at": e.backed_up_at,
                     "was_new": e.was_new,
+                    "size": e.size,
+                    "mtime_ns": e.mtime_ns,
                 }
                 for e in self.entries
             ],
@@ -100,25 +220,17 @@ class BackupManifest:
         Returns:
             BackupManifest instance.
         """
-        manifest = cls(
-            session_id=data["session_id"],
-            created_at=data["created_at"],
-            repo_path=data["repo_path"],
-            description=data.get("description", ""),
-            completed=data.get("completed", False),
-            rolled_back=data.get("rolled_back", False),
+        get = data.get
+        entry_from_dict = BackupEntry.from_dict  # Bound once for the whole list
+        return cls(
+            data["session_id"],
+            data["created_at"],
+            data["repo_path"],
+            get("description", ""),
+            [entry_from_dict(e) for e in get("entries", ())],
+            get("completed", False),
+            get("rolled_back", False),
         )
-        
-        for entry_data in data.get("entries", []):
-            manifest.entries.append(BackupEntry(
-                original_path=entry_data["original_path"],
-                backup_path=entry_data["backup_path"],
-                file_hash=entry_data["file_hash"],
-                backed_up_at=entry_data["backed_up_at"],
-                was_new=entry_data.get("was_new", False),
-            ))
-        
-        return manifest
 
 
 class BackupSession:
@@ -137,7 +249,8 @@ class BackupSession:
         self,
         manager: 'BackupManager',
         session_id: str,
-        description: str = ""
+        description: str = "",
+        manifest: Optional[BackupManifest] = None
     ):
         """Initialize a backup session.
         
@@ -145,24 +258,38 @@ class BackupSession:
             manager: Parent BackupManager.
             session_id: Unique session identifier.
             description: Human-readable description of the operation.
+            manifest: Manifest of an existing session to resume. When given,
+                nothing is written until the session records a change.
         """
         self.manager = manager
         self.session_id = session_id
         self.session_dir = manager.backup_root / session_id
         self.session_dir.mkdir(parents=True, exist_ok=True)
         
-        self.manifest = BackupManifest(
-            session_id=session_id,
-            created_at=datetime.now().isoformat(),
-            repo_path=str(manager.repo_path),
-            description=description,
-        )
-        
-        self._save_manifest()
+        resuming = manifest is not None
+        if manifest is None:
+            manifest = BackupManifest(
+                session_id=session_id,
+                created_at=datetime.now().isoformat(),
+                repo_path=str(manager.repo_path),
+                description=description,
+            )
+        self.manifest = manifest
+        
+        # Set when the in-memory manifest has changes not yet on disk
+        self._dirty = False
+        # Original paths already backed up; the first backup is the one to keep
+        self._seen: Set[str] = {e.original_path for e in manifest.entries}
+        # A resumed manifest is already on disk; rewriting it here is wasted work
+        if not resuming:
+            self._save_manifest()
     
     def backup_file(self, file_path: Path, mark_as_new: bool = False) -> bool:
         """Create a backup of a file before modifying it.
         
+        Files already backed up in this session are skipped, so a later
+        call never replaces the original copy with modified content.
+        
         Args:
             file_path: Path to the file to backup.
             mark_as_new: If True, marks file as newly created (for deletion on rollback).
@@ -170,11 +297,68 @@ class BackupSession:
         Returns:
             True if backup was successful, False otherwise.
         """
-        # Calculate relative path
+        success = self._backup_file(file_path, mark_as_new)
+        self._flush_manifest()
+        return success
+    
+    def _backup_file(self, file_path: Path, mark_as_new: bool) -> bool:
+        """Back up a file and record its entry without writing the manifest.
+        
+        Args:
+            file_path: Path to the file to backup.
+            mark_as_new: If True, marks file as newly created.
+            
+        Returns:
+            True if backup was successful, False otherwise.
+        """
+        if str(self._relative_path(file_path)) in self._seen:
+            return True
+        return self._record(self._copy_file(file_path, mark_as_new))
+    
+    def _record(self, entry: Optional[BackupEntry]) -> bool:
+        """Add an entry to the in-memory manifest.
+        
+        Args:
+            entry: Entry to add, or None if the backup failed.
+            
+        Returns:
+            True if an entry was added.
+        """
+        if entry is None:
+            return False
+        
+        self.manifest.entries.append(entry)
+        self._seen.add(entry.original_path)
+        self._dirty = True
+        return True
+    
+    def _relative_path(self, file_path: Path) -> Path:
+        """Path of a file relative to the repo, or its name if outside it.
+        
+        Args:
+            file_path: Path to the file.
+            
+        Returns:
+            Path used for the entry and inside the session directory.
+        """
         try:
-            relative_path = file_path.relative_to(self.manager.repo_path)
+            return file_path.relative_to(self.manager.repo_path)
         except ValueError:
-            relative_path = Path(file_path.name)
+            return Path(file_path.name)
+    
+    def _copy_file(self, file_path: Path, mark_as_new: bool) -> Optional[BackupEntry]:
+        """Copy a file into the session directory.
+        
+        Does not touch the manifest, so it is safe to call from worker threads.
+        
+        Args:
+            file_path: Path to the file to backup.
+            mark_as_new: If True, marks file as newly created.
+            
+        Returns:
+            Entry describing the backup, or None if the copy failed.
+        """
+        relative_path = self._relative_path(file_path)
         
         # Create backup directory structure
         backup_path = self.session_dir / relative_path
@@ -182,33 +366,35 @@ class BackupSession:
         
         # Calculate hash and copy if file exists
         file_hash = ""
+        size = mtime_ns = 0
         if file_path.exists() and not mark_as_new:
             try:
-                import hashlib
-                content = file_path.read_bytes()
-                file_hash = hashlib.md5(content).hexdigest()
+                stat = file_path.stat()
+                size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                file_hash = _hash_file(file_path)
+                # copy2 copies in-kernel (sendfile/fcopyfile) and keeps mtimes
                 shutil.copy2(file_path, backup_path)
             except Exception as e:
                 print(f"Warning: Could not backup {file_path}: {e}")
-                return False
+                return None
         
-        # Create entry
-        entry = BackupEntry(
+        return BackupEntry(
             original_path=str(relative_path),
             backup_path=str(backup_path),
             file_hash=file_hash,
             backed_up_at=datetime.now().isoformat(),
             was_new=mark_as_new,
+            size=size,
+            mtime_ns=mtime_ns,
         )
-        
-        self.manifest.entries.append(entry)
-        self._save_manifest()
-        
-        return True
     
     def backup_directory(self, dir_path: Path, mark_as_new: bool = False) -> bool:
         """Backup all files in a directory.
         
+        Files are hashed and copied on a thread pool; hashlib and the copy
+        syscalls release the GIL, so the I/O overlaps. Entries are added
+        to the manifest in directory walk order.
+        
         Args:
             dir_path: Path to the directory to backup.
             mark_as_new: If True, marks files as newly created.
@@ -219,12 +405,24 @@ class BackupSession:
         if not dir_path.exists():
             return True
         
+        files = [
+            p for p in dir_path.rglob("*")
+            if p.is_file() and str(self._relative_path(p)) not in self._seen
+        ]
+        if len(files) > 1:
+            workers = min(8, os.cpu_count() or 1, len(files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                entries = list(pool.map(lambda p: self._copy_file(p, mark_as_new), files))
+        else:
+            entries = [self._copy_file(p, mark_as_new) for p in files]
+        
         success = True
-        for file_path in dir_path.rglob("*"):
-            if file_path.is_file():
-                if not self.backup_file(file_path, mark_as_new):
-                    success = False
+        for entry in entries:
+            if not self._record(entry):
+                success = False
         
+        # One manifest write for the whole directory
+        self._flush_manifest()
         return success
     
     def rollback(self) -> bool:
@@ -265,11 +463,15 @@ class BackupSession:
         self.manifest.completed = True
         self._save_manifest()
     
+    def _flush_manifest(self) -> None:
+        """Write the manifest to disk if it changed since the last write."""
+        if self._dirty:
+            self._save_manifest()
+    
     def _save_manifest(self) -> None:
         """Save the manifest to disk."""
-        manifest_path = self.session_dir / "manifest.json"
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(self.manifest.to_dict(), f, indent=2)
+        _write_json(self.session_dir / "manifest.json", self.manifest.to_dict())
+        self._dirty = False
     
     def _cleanup_empty_dirs(self, dir_path: Path) -> None:
         """Remove empty directories up to the repo root.
@@ -317,6 +519,8 @@ class BackupManager:
         """
         self.repo_path = Path(repo_path)
         self.backup_root = self.repo_path / self.BACKUP_DIR_NAME
+        # Session name -> (mtime_ns, size, manifest) of the last parse
+        self._manifest_cache: Dict[str, Tuple[int, int, BackupManifest]] = {}
     
     def create_session(self, description: str = "") -> BackupSession:
         """Create a new backup session.
@@ -327,31 +531,61 @@ class BackupManager:
         Returns:
             New BackupSession instance.
         """
-        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Sessions started within the same second get a numeric suffix
+        session_id, suffix = base_id, 1
+        while (self.backup_root / session_id).exists():
+            session_id = f"{base_id}_{suffix}"
+            suffix += 1
+        
         return BackupSession(self, session_id, description)
     
     def list_sessions(self) -> List[BackupManifest]:
         """List all backup sessions.
         
+        Manifests are only re-parsed when their modification time or size
+        changed since the previous call. Each call returns fresh copies of
+        the cached manifests, so callers may modify them freely.
+        
         Returns:
             List of BackupManifest for all sessions.
         """
         sessions = []
         
         if not self.backup_root.exists():
+            self._manifest_cache = {}
             return sessions
         
-        for session_dir in sorted(self.backup_root.iterdir()):
-            if session_dir.is_dir():
-                manifest_path = session_dir / "manifest.json"
-                if manifest_path.exists():
-                    try:
-                        with open(manifest_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                        sessions.append(BackupManifest.from_dict(data))
-                    except Exception as e:
-                        print(f"Warning: Could not load manifest from {session_dir}: {e}")
+        with os.scandir(self.backup_root) as it:
+            session_dirs = sorted(
+                (entry for entry in it if entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
         
+        cache = {}
+        for session_dir in session_dirs:
+            manifest_path = Path(session_dir.path, "manifest.json")
+            try:
+                stat = manifest_path.stat()
+            except OSError:
+                continue
+            
+            cached = self._manifest_cache.get(session_dir.name)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                manifest = cached[2]
+            else:
+                try:
+                    manifest = BackupManifest.from_dict(_read_json(manifest_path))
+                except Exception as e:
+                    print(f"Warning: Could not load manifest from {session_dir.path}: {e}")
+                    continue
+            
+            cache[session_dir.name] = (stat.st_mtime_ns, stat.st_size, manifest)
+            # Entries are frozen, so copying the list is enough to detach it
+            sessions.append(replace(manifest, entries=list(manifest.entries)))
+        
+        self._manifest_cache = cache
         return sessions
     
     def get_session(self, session_id: str) -> Optional[BackupSession]:
@@ -370,12 +604,11 @@ class BackupManager:
             return None
         
         try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(manifest_path)
             
-            session = BackupSession(self, session_id)
-            session.manifest = BackupManifest.from_dict(data)
-            return session
+            return BackupSession(
+                self, session_id, manifest=BackupManifest.from_dict(data)
+            )
         except Exception:
             return None
     
@@ -433,12 +666,7 @@ class BackupManager:
         if not self.backup_root.exists():
             return 0
         
-        total = 0
-        for file_path in self.backup_root.rglob("*"):
-            if file_path.is_file():
-                total += file_path.stat().st_size
-        
-        return total
+        return _tree_size(self.backup_root)
     
     def format_backup_size(self) -> str:
         """Get human-readable backup size.
@@ -448,12 +676,9 @@ class BackupManager:
         """
         size = self.get_backup_size()
         
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        
-        return f"{size:.1f} TB"
+        # Each unit is 2**10 times the previous, so the bit length picks it
+        index = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def ensure_gitignore_excludes_backup(repo_path: Path) -> bool:
@@ -468,21 +693,17 @@ def ensure_gitignore_excludes_backup(repo_path: Path) -> bool:
     gitignore_path = repo_path / ".gitignore"
     backup_pattern = BackupManager.BACKUP_DIR_NAME + "/"
     
-    if gitignore_path.exists():
-        content = gitignore_path.read_text(encoding="utf-8")
-        if backup_pattern in content or BackupManager.BACKUP_DIR_NAME in content:
-            return True
-    else:
-        content = ""
-    
-    # Add the pattern
-    if not content.endswith("\n") and content:
-        content += "\n"
-    
-    content += f"\n# Cursor Agent Factory backup directory\n{backup_pattern}\n"
-    
     try:
-        gitignore_path.write_text(content, encoding="utf-8")
+        # One handle for both the check and the append; creates the file if missing
+        with open(gitignore_path, "a+", encoding="utf-8") as f:
+            f.seek(0)
+            content = f.read()
+            if BackupManager.BACKUP_DIR_NAME in content:
+                return True
+            
+            # Add the pattern
+            separator = "\n" if content and not content.endswith("\n") else ""
+            f.write(f"{separator}\n# Cursor Agent Factory backup directory\n{backup_pattern}\n")
         return True
     except Exception as e:
         print(f"Warning: Could not update .gitignore: {e}")
@@ -30,15 +30,79 @@ Version: 1.0.0
 
 import json
 import os
-import platform
 import re
+import sys
 import shutil
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Standard library json is used instead
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        Parsed content
+    """
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dump_json(path: Path, data: Any) -> None:
+    """Write data to a file as JSON indented by two spaces.
+    
+    Args:
+        path: File to write
+        data: JSON-serializable content
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+# Platform identifier, resolved once from sys.platform instead of uname()
+if sys.platform.startswith("win"):
+    _PLATFORM = "windows"
+elif sys.platform == "darwin":
+    _PLATFORM = "darwin"
+else:
+    _PLATFORM = "linux"
+
+
+def _env_var_value(match: "re.Match[str]") -> str:
+    """Replacement callback for ${VAR_NAME} references.
+    
+    Args:
+        match: Match whose first group is the variable name
+        
+    Returns:
+        Value of the environment variable, or an empty string if unset
+    """
+    return os.environ.get(match.group(1), "")
+
+
+def _path_or_command_exists(path: str) -> bool:
+    """Check if a path exists (file or command).
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if path exists
+    """
+    return Path(path).exists() or shutil.which(path) is not None
+
 
 @dataclass
 class ResolutionResult:
@@ -54,6 +118,21 @@ class ResolutionResult:
     path: str
 
 
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A single problem found while validating settings.
+    
+    Attributes:
+        key: Dot-notation path of the offending setting (e.g., "knowledge_evolution.mode")
+        message: Human-readable description of the problem
+    """
+    key: str
+    message: str
+    
+    def __str__(self) -> str:
+        return self.message
+
+
 @dataclass
 class KnowledgeEvolutionConfig:
     """Configuration for the knowledge evolution system.
@@ -114,16 +193,24 @@ class ConfigManager:
         "default"
     ]
     
-    def __init__(self, factory_root: Optional[Path] = None):
+    def __init__(
+        self,
+        factory_root: Optional[Path] = None,
+        path_exists: Optional[Callable[[str], bool]] = None
+    ):
         """Initialize the configuration manager.
         
         Args:
             factory_root: Root directory of the factory. Auto-detected if not provided.
+            path_exists: Check used when resolving tool paths. Defaults to
+                accepting existing files and commands found on PATH.
         """
+        self._path_exists = path_exists or _path_or_command_exists
         self._factory_root = factory_root or self._detect_factory_root()
         self._settings_path = self._factory_root / ".cursor" / "config" / "settings.json"
         self._legacy_tools_path = self._factory_root / ".cursor" / "config" / "tools.json"
         self._settings: Dict[str, Any] = {}
+        self._ke_cache: Optional[KnowledgeEvolutionConfig] = None
         self._platform = self._detect_platform()
         self._load_settings()
     
@@ -184,19 +271,12 @@ class ConfigManager:
         Returns:
             Platform identifier: 'windows', 'linux', or 'darwin'
         """
-        system = platform.system().lower()
-        if system == "windows":
-            return "windows"
-        elif system == "darwin":
-            return "darwin"
-        else:
-            return "linux"
+        return _PLATFORM
     
     def _load_settings(self) -> None:
         """Load settings from file, migrating from legacy format if needed."""
         if self._settings_path.exists():
-            with open(self._settings_path, "r", encoding="utf-8") as f:
-                self._settings = json.load(f)
+            self._settings = _load_json(self._settings_path)
         elif self._legacy_tools_path.exists():
             # Migrate from legacy tools.json
             self._migrate_from_legacy()
@@ -207,8 +287,7 @@ class ConfigManager:
     
     def _migrate_from_legacy(self) -> None:
         """Migrate from legacy tools.json to new settings.json format."""
-        with open(self._legacy_tools_path, "r", encoding="utf-8") as f:
-            legacy = json.load(f)
+        legacy = _load_json(self._legacy_tools_path)
         
         self._settings = self._create_default_settings()
         
@@ -319,8 +398,7 @@ class ConfigManager:
     def _save_settings(self) -> None:
         """Save current settings to file."""
         self._settings_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._settings_path, "w", encoding="utf-8") as f:
-            json.dump(self._settings, f, indent=2)
+        _dump_json(self._settings_path, self._settings)
     
     def _resolve_env_vars(self, value: str) -> str:
         """Resolve environment variable references in a string.
@@ -333,14 +411,11 @@ class ConfigManager:
         Returns:
             String with env vars resolved
         """
-        if not isinstance(value, str):
+        # Most settings hold no references; skip the regex scan for those
+        if not isinstance(value, str) or "${" not in value:
             return value
         
-        def replace_env_var(match):
-            var_name = match.group(1)
-            return os.environ.get(var_name, "")
-        
-        return self._ENV_VAR_PATTERN.sub(replace_env_var, value)
+        return self._ENV_VAR_PATTERN.sub(_env_var_value, value)
     
     def get(self, path: str, default: Any = None) -> Any:
         """Get a configuration value by dot-notation path.
@@ -375,7 +450,19 @@ class ConfigManager:
             value: Value to set
             save: Whether to save settings to file immediately
         """
-        parts = path.split(".")
+        self.set_raw(path.split("."), value, save)
+    
+    def set_raw(self, parts: Sequence[str], value: Any, save: bool = True) -> None:
+        """Set a configuration value by pre-split path components.
+        
+        Same as set(), for callers that reuse a key and want to skip
+        re-parsing the dotted string on every call.
+        
+        Args:
+            parts: Path components (e.g., ("knowledge_evolution", "mode"))
+            value: Value to set
+            save: Whether to save settings to file immediately
+        """
         target = self._settings
         
         for part in parts[:-1]:
@@ -385,6 +472,9 @@ class ConfigManager:
         
         target[parts[-1]] = value
         
+        if parts[0] == "knowledge_evolution":
+            self._ke_cache = None
+        
         if save:
             self._save_settings()
     
@@ -430,19 +520,21 @@ class ConfigManager:
         
         return None
     
-    def _path_exists(self, path: str) -> bool:
-        """Check if a path exists (file or command).
+    def get_knowledge_evolution_config(self) -> KnowledgeEvolutionConfig:
+        """Get the knowledge evolution configuration.
+        
+        The result is cached until the knowledge_evolution settings change
+        through set() or import_settings(), so treat it as read-only.
         
-        Args:
-            path: Path to check
-            
         Returns:
-            True if path exists
+            KnowledgeEvolutionConfig dataclass with all settings
         """
-        return Path(path).exists() or shutil.which(path) is not None
+        if self._ke_cache is None:
+            self._ke_cache = self._build_knowledge_evolution_config()
+        return self._ke_cache
     
-    def get_knowledge_evolution_config(self) -> KnowledgeEvolutionConfig:
-        """Get the knowledge evolution configuration.
+    def _build_knowledge_evolution_config(self) -> KnowledgeEvolutionConfig:
+        """Build the knowledge evolution configuration from the settings.
         
         Returns:
             KnowledgeEvolutionConfig dataclass with all settings
@@ -500,30 +592,45 @@ class ConfigManager:
         """Get the full settings dictionary (read-only copy)."""
         return self._settings.copy()
     
-    def validate_settings(self) -> List[str]:
+    def validate_settings(self, fail_fast: bool = False) -> List[ValidationIssue]:
         """Validate current settings against schema.
         
+        Args:
+            fail_fast: Stop at the first error, for callers that only need
+                to know whether the settings are valid
+        
         Returns:
-            List of validation errors, empty if valid
+            List of validation issues, empty if valid. str() of an issue
+            gives its message.
         """
-        errors = []
+        errors: List[ValidationIssue] = []
         
         # Check required sections
         required = ["system", "tools"]
         for section in required:
             if section not in self._settings:
-                errors.append(f"Missing required section: {section}")
+                errors.append(ValidationIssue(section, f"Missing required section: {section}"))
+                if fail_fast:
+                    return errors
         
         # Validate knowledge_evolution mode
         ke = self._settings.get("knowledge_evolution", {})
         valid_modes = ["stability_first", "awareness_hybrid", "freshness_first", "subscription"]
         if ke.get("mode") and ke["mode"] not in valid_modes:
-            errors.append(f"Invalid knowledge_evolution.mode: {ke['mode']}")
+            errors.append(ValidationIssue(
+                "knowledge_evolution.mode",
+                f"Invalid knowledge_evolution.mode: {ke['mode']}"
+            ))
+            if fail_fast:
+                return errors
         
         # Validate update_channel
         valid_channels = ["stable", "latest", "experimental"]
         if ke.get("update_channel") and ke["update_channel"] not in valid_channels:
-            errors.append(f"Invalid knowledge_evolution.update_channel: {ke['update_channel']}")
+            errors.append(ValidationIssue(
+                "knowledge_evolution.update_channel",
+                f"Invalid knowledge_evolution.update_channel: {ke['update_channel']}"
+            ))
         
         return errors
     
@@ -533,8 +640,7 @@ class ConfigManager:
         Args:
             path: Path to export to
         """
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self._settings, f, indent=2)
+        _dump_json(Path(path), self._settings)
     
     def import_settings(self, path: Path, merge: bool = False) -> None:
         """Import settings from a file.
@@ -543,13 +649,13 @@ class ConfigManager:
             path: Path to import from
             merge: If True, merge with existing. If False, replace.
         """
-        with open(path, "r", encoding="utf-8") as f:
-            imported = json.load(f)
+        imported = _load_json(Path(path))
         
         if merge:
             self._deep_merge(self._settings, imported)
         else:
             self._settings = imported
+        self._ke_cache = None
         
         self._save_settings()
     
@@ -43,25 +43,27 @@ class CheckResult:
         return self.level >= 4
 
 
-# Patterns for A4 (Non-Harm) violations
+# Patterns for A4 (Non-Harm) violations.
+# Each entry carries a lowercase literal that any match must contain, so
+# commands without it skip the regex entirely.
 DESTRUCTIVE_PATTERNS = [
     # File system dangers
-    (r'\brm\s+-rf\s+[/~]', "Recursive deletion of root or home directory"),
-    (r'\brmdir\s+/s\s+/q\s+[A-Z]:\\', "Recursive Windows directory deletion"),
-    (r'Remove-Item.*-Recurse.*-Force.*[/\\]$', "PowerShell recursive root deletion"),
-    (r'\bformat\s+[A-Z]:', "Disk format command"),
-    (r'\bdd\s+.*of=/dev/', "Direct disk write"),
+    (r'\brm\s+-rf\s+[/~]', "Recursive deletion of root or home directory", "rm"),
+    (r'\brmdir\s+/s\s+/q\s+[A-Z]:\\', "Recursive Windows directory deletion", "rmdir"),
+    (r'Remove-Item.*-Recurse.*-Force.*[/\\]$', "PowerShell recursive root deletion", "remove-item"),
+    (r'\bformat\s+[A-Z]:', "Disk format command", "format"),
+    (r'\bdd\s+.*of=/dev/', "Direct disk write", "dd"),
     
     # Database dangers
-    (r'DROP\s+DATABASE', "Database drop command"),
-    (r'DROP\s+TABLE(?!.*IF\s+EXISTS)', "Table drop without IF EXISTS"),
-    (r'TRUNCATE\s+TABLE', "Table truncation"),
-    (r'DELETE\s+FROM\s+\w+\s*(?:;|$)', "DELETE without WHERE clause"),
+    (r'DROP\s+DATABASE', "Database drop command", "drop"),
+    (r'DROP\s+TABLE(?!.*IF\s+EXISTS)', "Table drop without IF EXISTS", "drop"),
+    (r'TRUNCATE\s+TABLE', "Table truncation", "truncate"),
+    (r'DELETE\s+FROM\s+\w+\s*(?:;|$)', "DELETE without WHERE clause", "delete"),
     
     # System dangers
-    (r'\bkill\s+-9\s+-1', "Kill all processes"),
-    (r'\bshutdown\b', "System shutdown"),
-    (r'\breboot\b', "System reboot"),
+    (r'\bkill\s+-9\s+-1', "Kill all processes", "kill"),
+    (r'\bshutdown\b', "System shutdown", "shutdown"),
+    (r'\breboot\b', "System reboot", "reboot"),
 ]
 
 # Patterns for sensitive file access
@@ -84,6 +86,34 @@ CRITICAL_PATHS = [
     r'^C:\\Program Files',
 ]
 
+# Patterns that suggest claims needing verification (A1)
+CLAIM_PATTERNS = [
+    (r'\b(always|never|definitely|certainly|guaranteed)\b', "Absolute claim"),
+    (r'\baccording to\s+(?!the\s+(?:documentation|source|file))', "External reference claim"),
+    (r'\b\d+\s*%', "Statistical claim"),
+]
+
+# Compiled once at import; every check below runs against these
+_DESTRUCTIVE_REGEXES = [
+    (re.compile(p, re.IGNORECASE), d, literal) for p, d, literal in DESTRUCTIVE_PATTERNS
+]
+_SENSITIVE_PATH_REGEXES = [re.compile(p, re.IGNORECASE) for p in SENSITIVE_PATHS]
+_CRITICAL_PATH_REGEXES = [re.compile(p, re.IGNORECASE) for p in CRITICAL_PATHS]
+_CLAIM_REGEXES = [(re.compile(p, re.IGNORECASE), d) for p, d in CLAIM_PATTERNS]
+
+# One alternation per path list answers "does anything match?" in a single
+# search; the individual regexes are only consulted on a hit, to report
+# the first matching pattern in priority order.
+_ANY_SENSITIVE_PATH = re.compile('|'.join(f'(?:{p})' for p in SENSITIVE_PATHS), re.IGNORECASE)
+_ANY_CRITICAL_PATH = re.compile('|'.join(f'(?:{p})' for p in CRITICAL_PATHS), re.IGNORECASE)
+
+
+def _first_match(any_regex: re.Pattern, regexes: List[re.Pattern], text: str) -> Optional[re.Pattern]:
+    """Return the first regex in priority order that matches text, if any."""
+    if not any_regex.search(text):
+        return None
+    return next((regex for regex in regexes if regex.search(text)), None)
+
 
 def check_command(command: str) -> CheckResult:
     """
@@ -95,43 +125,42 @@ def check_command(command: str) -> CheckResult:
     Returns:
         CheckResult with violation details if any
     """
+    # Check for destructive patterns (A4); the literal test is a cheap prefilter
     command_lower = command.lower()
-    
-    # Check for destructive patterns (A4)
-    for pattern, description in DESTRUCTIVE_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
+    for regex, description, literal in _DESTRUCTIVE_REGEXES:
+        if literal in command_lower and regex.search(command):
             return CheckResult(
                 passed=False,
                 level=4,
                 axiom="A4",
                 violation=AxiomViolation.A4_HARMFUL,
                 message=f"Potentially harmful command detected: {description}",
-                details={"command": command, "pattern": pattern}
+                details={"command": command, "pattern": regex.pattern}
             )
     
     # Check for operations on sensitive paths (A4, lower severity)
-    for pattern in SENSITIVE_PATHS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return CheckResult(
-                passed=False,
-                level=2,
-                axiom="A4",
-                violation=AxiomViolation.A4_HARMFUL,
-                message="Command involves sensitive file",
-                details={"command": command, "pattern": pattern}
-            )
+    regex = _first_match(_ANY_SENSITIVE_PATH, _SENSITIVE_PATH_REGEXES, command)
+    if regex:
+        return CheckResult(
+            passed=False,
+            level=2,
+            axiom="A4",
+            violation=AxiomViolation.A4_HARMFUL,
+            message="Command involves sensitive file",
+            details={"command": command, "pattern": regex.pattern}
+        )
     
     # Check for operations on critical system paths
-    for pattern in CRITICAL_PATHS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return CheckResult(
-                passed=False,
-                level=3,
-                axiom="A4",
-                violation=AxiomViolation.A4_HARMFUL,
-                message="Command involves critical system path",
-                details={"command": command, "pattern": pattern}
-            )
+    regex = _first_match(_ANY_CRITICAL_PATH, _CRITICAL_PATH_REGEXES, command)
+    if regex:
+        return CheckResult(
+            passed=False,
+            level=3,
+            axiom="A4",
+            violation=AxiomViolation.A4_HARMFUL,
+            message="Command involves critical system path",
+            details={"command": command, "pattern": regex.pattern}
+        )
     
     return CheckResult(passed=True, level=0)
 
@@ -148,46 +177,44 @@ def check_file_operation(operation: str, file_path: str) -> CheckResult:
         CheckResult with violation details if any
     """
     path = Path(file_path)
+    path_str = str(path)
     operation = operation.lower()
     
     # Deletion operations need extra scrutiny
     if operation in ('delete', 'remove', 'rm'):
         # Check for sensitive files
-        for pattern in SENSITIVE_PATHS:
-            if re.search(pattern, str(path), re.IGNORECASE):
-                return CheckResult(
-                    passed=False,
-                    level=3,
-                    axiom="A4",
-                    violation=AxiomViolation.A4_HARMFUL,
-                    message=f"Deletion of sensitive file: {path}",
-                    details={"operation": operation, "path": str(path)}
-                )
+        if _ANY_SENSITIVE_PATH.search(path_str):
+            return CheckResult(
+                passed=False,
+                level=3,
+                axiom="A4",
+                violation=AxiomViolation.A4_HARMFUL,
+                message=f"Deletion of sensitive file: {path}",
+                details={"operation": operation, "path": path_str}
+            )
         
         # Check for critical system files
-        for pattern in CRITICAL_PATHS:
-            if re.search(pattern, str(path), re.IGNORECASE):
-                return CheckResult(
-                    passed=False,
-                    level=4,
-                    axiom="A4",
-                    violation=AxiomViolation.A4_HARMFUL,
-                    message=f"Deletion of critical system file: {path}",
-                    details={"operation": operation, "path": str(path)}
-                )
+        if _ANY_CRITICAL_PATH.search(path_str):
+            return CheckResult(
+                passed=False,
+                level=4,
+                axiom="A4",
+                violation=AxiomViolation.A4_HARMFUL,
+                message=f"Deletion of critical system file: {path}",
+                details={"operation": operation, "path": path_str}
+            )
     
     # Write to sensitive locations
     if operation in ('write', 'create', 'overwrite'):
-        for pattern in CRITICAL_PATHS:
-            if re.search(pattern, str(path), re.IGNORECASE):
-                return CheckResult(
-                    passed=False,
-                    level=3,
-                    axiom="A4",
-                    violation=AxiomViolation.A4_HARMFUL,
-                    message=f"Write to critical system location: {path}",
-                    details={"operation": operation, "path": str(path)}
-                )
+        if _ANY_CRITICAL_PATH.search(path_str):
+            return CheckResult(
+                passed=False,
+                level=3,
+                axiom="A4",
+                violation=AxiomViolation.A4_HARMFUL,
+                message=f"Write to critical system location: {path}",
+                details={"operation": operation, "path": path_str}
+            )
     
     return CheckResult(passed=True, level=0)
 
@@ -205,22 +232,15 @@ def check_content_for_claims(content: str) -> CheckResult:
     Returns:
         CheckResult with violation details if any
     """
-    # Patterns that suggest claims needing verification
-    claim_patterns = [
-        (r'\b(always|never|definitely|certainly|guaranteed)\b', "Absolute claim"),
-        (r'\baccording to\s+(?!the\s+(?:documentation|source|file))', "External reference claim"),
-        (r'\b\d+\s*%', "Statistical claim"),
-    ]
-    
     # This is informational only - LLM context determines actual handling
-    for pattern, description in claim_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
+    for regex, description in _CLAIM_REGEXES:
+        if regex.search(content):
             return CheckResult(
                 passed=True,  # Not a block, just awareness
                 level=1,
                 axiom="A1",
                 message=f"Content contains {description} - verify if possible",
-                details={"pattern": pattern}
+                details={"pattern": regex.pattern}
             )
     
     return CheckResult(passed=True, level=0)
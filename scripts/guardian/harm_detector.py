@@ -29,7 +29,7 @@ class HarmReport:
     details: List[str]
     recommendations: List[str]
     
-    def __str__(self):
+    def __str__(self) -> str:
         if self.safe:
             return "No harm detected"
         return f"[LEVEL {self.level}] {self.category}: {self.summary}"
@@ -69,6 +69,10 @@ CAUTION_FILE_PATTERNS = [
     (r'gitlab-ci\.yml', "CI/CD pipeline"),
 ]
 
+# Compiled once at import; content patterns carry their own (?i) flags
+_HARMFUL_CONTENT_REGEXES = [(re.compile(p), d, a) for p, d, a in HARMFUL_CONTENT_PATTERNS]
+_CAUTION_FILE_REGEXES = [(re.compile(p, re.IGNORECASE), r) for p, r in CAUTION_FILE_PATTERNS]
+
 
 def analyze_command(command: str) -> HarmReport:
     """
@@ -129,8 +133,8 @@ def analyze_file_operation(operation: str, path: str, content: Optional[str] = N
         details.append(op_result.message)
     
     # Check for caution-worthy files
-    for pattern, reason in CAUTION_FILE_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
+    for regex, reason in _CAUTION_FILE_REGEXES:
+        if regex.search(path):
             max_level = max(max_level, 2)  # At least pause level
             details.append(f"Caution: {reason}")
             recommendations.append(f"This file affects {reason.lower()}")
@@ -181,8 +185,8 @@ def analyze_content(content: str) -> HarmReport:
     axioms_involved = set()
     
     # Check for harmful content patterns
-    for pattern, description, axiom in HARMFUL_CONTENT_PATTERNS:
-        if re.search(pattern, content):
+    for regex, description, axiom in _HARMFUL_CONTENT_REGEXES:
+        if regex.search(content):
             max_level = max(max_level, 3)  # Block level
             details.append(f"{description} ({axiom})")
             axioms_involved.add(axiom)
@@ -12,9 +12,14 @@ Based on common secret patterns from security tools like:
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import re2  # google-re2: linear-time DFA matching, no catastrophic backtracking
+except ImportError:
+    re2 = None  # Fall back to the standard library engine
+
 
 @dataclass
 class SecretMatch:
@@ -25,7 +30,7 @@ class SecretMatch:
     severity: str  # 'high', 'medium', 'low'
     redacted: str  # Safe version for display
     
-    def __str__(self):
+    def __str__(self) -> str:
         return f"[{self.severity.upper()}] {self.pattern_name} at line {self.line_number}: {self.redacted}"
 
 
@@ -85,6 +90,32 @@ FALSE_POSITIVE_PATTERNS = [
 ]
 
 
+def _compile_secret_pattern(pattern: str) -> Any:
+    """Compile with RE2 when available, falling back to re for unsupported syntax."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Compiled once at import; tuples so the shared tables stay immutable.
+# Secret patterns run over arbitrary file content, so they prefer RE2.
+_SECRET_REGEXES = tuple(
+    (_compile_secret_pattern(p), name, severity) for p, name, severity in SECRET_PATTERNS
+)
+_FALSE_POSITIVE_REGEXES = tuple(re.compile(p) for p in FALSE_POSITIVE_PATTERNS)
+
+
+# Shortest text any SECRET_PATTERNS entry can match: the Google OAuth
+# Token pattern, "ya29." plus one character. Content or lines shorter than
+# this (blank lines, short statements) skip every regex. Keep it in sync
+# when adding patterns; tests/unit/test_guardian_secret_scanner.py pins it
+# against the shortest sample secret for each pattern.
+_MIN_SECRET_LEN = 6
+
+
 def redact_secret(text: str) -> str:
     """Redact a secret for safe display."""
     if len(text) <= 8:
@@ -95,8 +126,8 @@ def redact_secret(text: str) -> str:
 def is_false_positive(text: str) -> bool:
     """Check if a match is likely a false positive."""
     text_lower = text.lower()
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, text_lower):
+    for regex in _FALSE_POSITIVE_REGEXES:
+        if regex.search(text_lower):
             return True
     return False
 
@@ -111,12 +142,17 @@ def scan_content(content: str) -> List[SecretMatch]:
     Returns:
         List of SecretMatch objects for detected secrets
     """
+    if len(content) < _MIN_SECRET_LEN:
+        return []
+    
     matches = []
     lines = content.split('\n')
     
     for line_num, line in enumerate(lines, 1):
-        for pattern, name, severity in SECRET_PATTERNS:
-            for match in re.finditer(pattern, line):
+        if len(line) < _MIN_SECRET_LEN:
+            continue
+        for regex, name, severity in _SECRET_REGEXES:
+            for match in regex.finditer(line):
                 matched_text = match.group()
                 
                 # Skip false positives
@@ -198,14 +234,15 @@ def get_severity_level(matches: List[SecretMatch]) -> int:
     if not matches:
         return 0
     
-    severities = [m.severity for m in matches]
+    # Single pass; the first high-severity match decides the outcome
+    level = 2  # Pause - ask user
+    for match in matches:
+        if match.severity == 'high':
+            return 4  # Emergency - prevent commit
+        if match.severity == 'medium':
+            level = 3  # Block - require confirmation
     
-    if 'high' in severities:
-        return 4  # Emergency - prevent commit
-    elif 'medium' in severities:
-        return 3  # Block - require confirmation
-    else:
-        return 2  # Pause - ask user
+    return level
 
 
 if __name__ == "__main__":
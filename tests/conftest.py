@@ -16,14 +16,27 @@ Test Markers for Intelligent Packaging:
 - @pytest.mark.quickstart: Full quickstart workflow tests
 """
 
+import hashlib
 import json
+import pickle
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
 
 import pytest
 
 
+def pytest_addoption(parser):
+    """Register factory-specific command line options."""
+    parser.addoption(
+        "--cached-gap-analysis",
+        action="store_true",
+        default=False,
+        help="Reuse gap analysis results from .pytest_cache while the "
+             "knowledge tree is unchanged (clear with --cache-clear).",
+    )
+
+
 def pytest_collection_modifyitems(config, items):
     """
     Automatically apply markers based on test location and name.
@@ -33,7 +46,9 @@ def pytest_collection_modifyitems(config, items):
     2. Validation tests run second (fast)
     3. Integration tests run last (slow)
     
-    Within integration, quickstart tests are marked slowest.
+    Within integration, quickstart tests are marked slowest and Guardian
+    tests fast. All Guardian tests are also marked ``guardian`` so they can
+    be run on their own, e.g. ``pytest -m guardian -n auto``.
     """
     for item in items:
         # Get the test file path relative to tests/
@@ -62,15 +77,27 @@ def pytest_collection_modifyitems(config, items):
             elif "generation" in test_path:
                 item.add_marker(pytest.mark.generation)
                 item.add_marker(pytest.mark.medium)
-
-# Add project root to path for imports
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+            elif "guardian" in test_path:
+                # Pure in-process checks against precompiled rule tables
+                item.add_marker(pytest.mark.fast)
+        
+        # Guardian tests share no mutable state, so they parallelize cleanly
+        if "guardian" in test_path:
+            item.add_marker(pytest.mark.guardian)
+
+# Add project root (for ``scripts.*``/``cli.*``) and the scripts directory
+# (for ``guardian.*``, ``adapters.*``) to the import path, once per session.
+# Resolved once here so test modules and fixtures never recompute it.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+for _import_root in (PROJECT_ROOT, SCRIPTS_DIR):
+    if str(_import_root) not in sys.path:
+        sys.path.insert(0, str(_import_root))
 
 from scripts.generate_project import ProjectConfig, ProjectGenerator  # noqa: E402
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def factory_root() -> Path:
     """Get the factory root directory.
     
@@ -116,6 +143,21 @@ def sample_config() -> ProjectConfig:
     )
 
 
+@pytest.fixture
+def make_config() -> Callable[..., ProjectConfig]:
+    """Provide a factory for ProjectConfig instances with test defaults.
+    
+    Returns:
+        Callable that builds a ProjectConfig from keyword overrides.
+    """
+    def _make(**overrides: Any) -> ProjectConfig:
+        fields: Dict[str, Any] = {"project_name": "test-project"}
+        fields.update(overrides)
+        return ProjectConfig(**fields)
+    
+    return _make
+
+
 @pytest.fixture
 def sample_config_dict() -> Dict[str, Any]:
     """Create a sample configuration dictionary.
@@ -232,12 +274,13 @@ def sample_json_config(tmp_path: Path, sample_config_dict: Dict[str, Any]) -> Pa
     return json_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def python_executable() -> str:
     """Get the Python executable path for CLI tests.
     
     Uses sys.executable to ensure the correct Python interpreter is used
-    regardless of the environment (local, CI, etc.).
+    regardless of the environment (local, CI, etc.). Session-scoped since
+    the interpreter cannot change during a run.
     
     Returns:
         Path to Python executable.
@@ -245,7 +288,7 @@ def python_executable() -> str:
     return sys.executable
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_path(factory_root: Path) -> Path:
     """Get the CLI script path.
     
@@ -466,6 +509,77 @@ def mock_taxonomy_file(tmp_path: Path, sample_taxonomy_data: Dict[str, Any]) ->
     return taxonomy_file
 
 
+def _gap_analysis_sources() -> List[Path]:
+    """Source files whose code determines the gap analysis result.
+    
+    Returns:
+        The analyzer module and every module of the taxonomy package.
+    """
+    return [SCRIPTS_DIR / "knowledge_gap_analyzer.py",
+            *sorted((SCRIPTS_DIR / "taxonomy").rglob("*.py"))]
+
+
+def _knowledge_tree_fingerprint(knowledge_dir: Path, taxonomy_file: Path) -> str:
+    """Fingerprint a knowledge tree and the code that analyses it.
+    
+    Knowledge and taxonomy files contribute their names, sizes and mtimes;
+    the analyzer sources contribute a hash of their contents, so editing
+    the analysis code invalidates cached results too.
+    
+    Args:
+        knowledge_dir: Directory of knowledge JSON files.
+        taxonomy_file: Taxonomy file the analysis runs against.
+        
+    Returns:
+        Hex digest that changes whenever any input file or analyzer source changes.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(knowledge_dir.glob("*.json")) + [taxonomy_file]:
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    for path in _gap_analysis_sources():
+        digest.update(f"{path.relative_to(SCRIPTS_DIR).as_posix()}:".encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+@pytest.fixture
+def default_gap_analysis(request, knowledge_dir: Path, taxonomy_dir: Path):
+    """Run gap analysis over the default knowledge directory.
+    
+    With --cached-gap-analysis the pickled AnalysisResult is stored under
+    .pytest_cache keyed by a fingerprint of the knowledge tree, so repeat
+    runs skip the full scan until a knowledge or taxonomy file, or the
+    analyzer code itself, changes.
+    
+    Args:
+        request: Pytest request, used to reach the config cache.
+        knowledge_dir: Knowledge directory fixture.
+        taxonomy_dir: Taxonomy directory fixture.
+        
+    Returns:
+        AnalysisResult for the default knowledge directory.
+    """
+    from scripts.knowledge_gap_analyzer import run_gap_analysis
+    
+    cache = getattr(request.config, "cache", None)
+    if cache is None or not request.config.getoption("--cached-gap-analysis"):
+        return run_gap_analysis()
+    
+    fingerprint = _knowledge_tree_fingerprint(
+        knowledge_dir, taxonomy_dir / "agent_taxonomy.json"
+    )
+    cache_file = cache.mkdir("gap-analysis") / f"{fingerprint}.pickle"
+    if cache_file.exists():
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    
+    result = run_gap_analysis()
+    with open(cache_file, "wb") as f:
+        pickle.dump(result, f)
+    return result
+
+
 @pytest.fixture
 def extension_templates_dir(factory_root: Path) -> Path:
     """Get the extension templates directory.
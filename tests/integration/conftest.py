@@ -0,0 +1,211 @@
+"""
+Shared fixtures for integration tests.
+
+Project generation touches dozens of files on disk, so each distinct
+configuration "shape" is generated once per session and shared by every
+test that only asserts on the resulting tree. Tests that mutate the tree
+or depend on an isolated output directory keep using temp_output_dir.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from scripts.generate_project import ProjectConfig, ProjectGenerator
+
+
+GeneratedProject = Tuple[Path, Dict[str, Any]]
+
+
+def _generate_once(tmp_path_factory, name: str, config: ProjectConfig) -> GeneratedProject:
+    """Generate a project into a fresh session-scoped directory.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+        name: Base name for the output directory.
+        config: Project configuration to generate.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    output_dir = tmp_path_factory.mktemp(name)
+    result = ProjectGenerator(config, str(output_dir)).generate()
+    return output_dir, result
+
+
+@pytest.fixture(scope="session")
+def generated_full_project(tmp_path_factory) -> GeneratedProject:
+    """Project generated with agents, skills and workflow triggers.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    config = ProjectConfig(
+        project_name="complete-structure-test",
+        project_description="Testing complete structure",
+        domain="testing-domain",
+        primary_language="typescript",
+        style_guide="google",
+        agents=["code-reviewer", "test-generator"],
+        skills=["bugfix-workflow", "tdd"],
+        triggers=["jira", "confluence"]
+    )
+    return _generate_once(tmp_path_factory, "full-project", config)
+
+
+def _read_text_files(output_dir: Path) -> Dict[str, str]:
+    """Read every generated markdown and .cursorrules file in one pass.
+
+    Args:
+        output_dir: Root of a generated project.
+
+    Returns:
+        Mapping of POSIX-style relative path to file content.
+    """
+    return {
+        path.relative_to(output_dir).as_posix(): path.read_text(encoding='utf-8')
+        for path in output_dir.rglob("*")
+        if path.is_file() and (path.suffix == ".md" or path.name == ".cursorrules")
+    }
+
+
+@pytest.fixture(scope="session")
+def generated_full_contents(generated_full_project: GeneratedProject) -> Dict[str, str]:
+    """Text contents of the full-featured generated project.
+
+    Args:
+        generated_full_project: Shared full-featured project fixture.
+
+    Returns:
+        Mapping of relative path to file content.
+    """
+    output_dir, _ = generated_full_project
+    return _read_text_files(output_dir)
+
+
+@pytest.fixture(scope="session")
+def generated_minimal_project(tmp_path_factory) -> GeneratedProject:
+    """Project generated from a name only, relying on all defaults.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    config = ProjectConfig(project_name="templates-test")
+    return _generate_once(tmp_path_factory, "minimal-project", config)
+
+
+@pytest.fixture(scope="session")
+def generated_fastapi_blueprint(tmp_path_factory) -> GeneratedProject:
+    """Project generated from the python-fastapi blueprint.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    config = ProjectConfig(
+        project_name="fastapi-test",
+        project_description="FastAPI test project",
+        primary_language="python",
+        blueprint_id="python-fastapi",
+        agents=["code-reviewer"],
+        skills=["bugfix-workflow", "tdd"]
+    )
+    return _generate_once(tmp_path_factory, "fastapi-blueprint", config)
+
+
+@pytest.fixture(scope="session")
+def generated_mcp_project(tmp_path_factory) -> GeneratedProject:
+    """Project generated with MCP servers configured.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    config = ProjectConfig(
+        project_name="mcp-test",
+        mcp_servers=[
+            {"name": "atlassian", "url": "https://mcp.atlassian.com", "purpose": "Jira"},
+            {"name": "deepwiki", "url": "https://deepwiki.com", "purpose": "GitHub"}
+        ]
+    )
+    return _generate_once(tmp_path_factory, "mcp-project", config)
+
+
+@pytest.fixture(scope="session")
+def generated_mcp_contents(generated_mcp_project: GeneratedProject) -> Dict[str, str]:
+    """Text contents of the MCP-configured generated project.
+
+    Args:
+        generated_mcp_project: Shared MCP project fixture.
+
+    Returns:
+        Mapping of relative path to file content.
+    """
+    output_dir, _ = generated_mcp_project
+    return _read_text_files(output_dir)
+
+
+@pytest.fixture(scope="session")
+def generated_jira_project(tmp_path_factory) -> GeneratedProject:
+    """Project generated with only the jira workflow trigger.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    config = ProjectConfig(project_name="jira-workflow-test", triggers=["jira"])
+    return _generate_once(tmp_path_factory, "jira-project", config)
+
+
+@pytest.fixture(scope="session")
+def generated_confluence_project(tmp_path_factory) -> GeneratedProject:
+    """Project generated with only the confluence workflow trigger.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Tuple of (output directory, generation result).
+    """
+    config = ProjectConfig(project_name="confluence-workflow-test", triggers=["confluence"])
+    return _generate_once(tmp_path_factory, "confluence-project", config)
+
+
+# Guardian checks are pure functions of their input, and several tests
+# probe the same inputs (e.g. "rm -rf /"). These session fixtures hand out
+# memoized wrappers so each distinct input is analysed once per session.
+# Callers must treat the returned results as read-only.
+
+@pytest.fixture(scope="session")
+def cached_check_command():
+    """Memoized guardian.axiom_checker.check_command."""
+    from guardian.axiom_checker import check_command
+    return functools.lru_cache(maxsize=None)(check_command)
+
+
+@pytest.fixture(scope="session")
+def cached_scan_content():
+    """Memoized guardian.secret_scanner.scan_content."""
+    from guardian.secret_scanner import scan_content
+    return functools.lru_cache(maxsize=None)(scan_content)
+
+
+@pytest.fixture(scope="session")
+def cached_analyze_content():
+    """Memoized guardian.harm_detector.analyze_content."""
+    from guardian.harm_detector import analyze_content
+    return functools.lru_cache(maxsize=None)(analyze_content)
@@ -11,11 +11,6 @@ Tests cover:
 """
 
 import subprocess
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 class TestCLIHelp:
@@ -166,8 +161,8 @@ class TestBlueprintGeneration:
         )
         
         assert result.returncode != 0
-        assert "output" in result.stdout.lower() or "output" in result.stderr.lower() \
-            or "required" in result.stdout.lower() or "required" in result.stderr.lower()
+        output_lc = (result.stdout + result.stderr).lower()
+        assert "output" in output_lc or "required" in output_lc
     
     def test_blueprint_generation_invalid_blueprint(self, python_executable, cli_path, temp_output_dir):
         """Test that invalid blueprint ID fails."""
@@ -181,7 +176,8 @@ class TestBlueprintGeneration:
         )
         
         assert result.returncode != 0
-        assert "not found" in result.stdout.lower() or "error" in result.stdout.lower()
+        stdout_lc = result.stdout.lower()
+        assert "not found" in stdout_lc or "error" in stdout_lc
     
     def test_blueprint_generation_success(self, python_executable, cli_path, temp_output_dir):
         """Test successful blueprint generation."""
@@ -247,7 +243,8 @@ class TestConfigGeneration:
         )
         
         assert result.returncode != 0
-        assert "not found" in result.stdout.lower() or "error" in result.stdout.lower()
+        stdout_lc = result.stdout.lower()
+        assert "not found" in stdout_lc or "error" in stdout_lc
     
     def test_config_generation_from_json(self, python_executable, cli_path, sample_json_config, temp_output_dir):
         """Test generation from JSON config file."""
@@ -330,7 +327,8 @@ class TestQuickStart:
         )
         
         # Check for celebratory language
-        assert "congratulations" in result.stdout.lower() or "ready" in result.stdout.lower()
+        stdout_lc = result.stdout.lower()
+        assert "congratulations" in stdout_lc or "ready" in stdout_lc
     
     def test_quickstart_creates_cursorrules(self, python_executable, cli_path, temp_output_dir):
         """Test that --quickstart creates .cursorrules file."""
@@ -441,7 +439,8 @@ class TestQuickStart:
         )
         
         # Should show guidance for what to do next
-        assert "cursor" in result.stdout.lower() or "interactive" in result.stdout.lower()
+        stdout_lc = result.stdout.lower()
+        assert "cursor" in stdout_lc or "interactive" in stdout_lc
     
     def test_help_shows_quickstart_option(self, python_executable, cli_path):
         """Test that --help shows the --quickstart option."""
@@ -8,14 +8,9 @@ Tests cover:
 """
 
 import subprocess
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 class TestAnalyzeGapsCommand:
     """Tests for --analyze-gaps CLI command."""
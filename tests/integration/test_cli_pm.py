@@ -8,11 +8,31 @@ Tests cover:
 """
 
 import subprocess
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+def _run_concurrently(commands: Dict[str, List[str]],
+                      timeout: int = 60) -> Dict[str, subprocess.CompletedProcess]:
+    """Run independent CLI invocations in parallel and collect their results.
+    
+    Each command is an isolated subprocess, so a thread per command is enough
+    to overlap them; the GIL is released while waiting on the child.
+    
+    Args:
+        commands: Mapping of label to argument vector.
+        timeout: Per-command timeout in seconds.
+        
+    Returns:
+        Mapping of label to completed process.
+    """
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        futures = {
+            label: executor.submit(subprocess.run, argv,
+                                   capture_output=True, text=True, timeout=timeout)
+            for label, argv in commands.items()
+        }
+        return {label: future.result() for label, future in futures.items()}
 
 
 class TestPMHelpOutput:
@@ -152,21 +172,17 @@ class TestPMBackendValidation:
         """Test that valid PM backends are accepted."""
         valid_backends = ['github', 'jira', 'azure-devops', 'linear']
         
-        for backend in valid_backends:
-            output_dir = temp_output_dir / f"pm-backend-{backend}"
-            
-            result = subprocess.run(
-                [python_executable, str(cli_path),
-                 "--blueprint", "python-fastapi",
-                 "--output", str(output_dir),
-                 "--pm-enabled",
-                 "--pm-backend", backend,
-                 "--pm-methodology", "scrum"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
+        commands = {
+            backend: [python_executable, str(cli_path),
+                      "--blueprint", "python-fastapi",
+                      "--output", str(temp_output_dir / f"pm-backend-{backend}"),
+                      "--pm-enabled",
+                      "--pm-backend", backend,
+                      "--pm-methodology", "scrum"]
+            for backend in valid_backends
+        }
+        
+        for backend, result in _run_concurrently(commands).items():
             # Should succeed (returncode 0) or at least not fail with validation error
             assert result.returncode == 0 or "invalid" not in result.stderr.lower(), \
                 f"Backend {backend} should be accepted but got error: {result.stderr}"
@@ -175,21 +191,17 @@ class TestPMBackendValidation:
         """Test that valid PM methodologies are accepted."""
         valid_methodologies = ['scrum', 'kanban', 'hybrid', 'waterfall']
         
-        for methodology in valid_methodologies:
-            output_dir = temp_output_dir / f"pm-methodology-{methodology}"
-            
-            result = subprocess.run(
-                [python_executable, str(cli_path),
-                 "--blueprint", "python-fastapi",
-                 "--output", str(output_dir),
-                 "--pm-enabled",
-                 "--pm-backend", "github",
-                 "--pm-methodology", methodology],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
+        commands = {
+            methodology: [python_executable, str(cli_path),
+                          "--blueprint", "python-fastapi",
+                          "--output", str(temp_output_dir / f"pm-methodology-{methodology}"),
+                          "--pm-enabled",
+                          "--pm-backend", "github",
+                          "--pm-methodology", methodology]
+            for methodology in valid_methodologies
+        }
+        
+        for methodology, result in _run_concurrently(commands).items():
             # Should succeed (returncode 0) or at least not fail with validation error
             assert result.returncode == 0 or "invalid" not in result.stderr.lower(), \
                 f"Methodology {methodology} should be accepted but got error: {result.stderr}"
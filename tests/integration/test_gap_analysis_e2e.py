@@ -5,14 +5,10 @@ Tests cover the complete gap analysis workflow from start to finish.
 """
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.knowledge_gap_analyzer import (
     KnowledgeGapAnalyzer,
     AnalysisResult,
@@ -22,6 +18,47 @@ from scripts.knowledge_gap_analyzer import (
 from scripts.taxonomy import TaxonomyLoader, load_agent_taxonomy
 
 
+# Minimal taxonomy for controlled testing: one topic the mock knowledge
+# covers and one it cannot possibly cover.
+MOCK_TAXONOMY_DATA = {
+    "domains": {
+        "test_domain": {
+            "description": "Test domain",
+            "required_depth": 2,
+            "topics": {
+                "covered_topic": {
+                    "description": "A topic that is covered",
+                    "keywords": ["test", "pattern"],
+                    "required_depth": 1
+                },
+                "missing_topic": {
+                    "description": "A topic that is NOT covered",
+                    "keywords": ["xyznonexistent123"],
+                    "required_depth": 2
+                }
+            }
+        }
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def session_mock_taxonomy_dir(tmp_path_factory) -> Path:
+    """Write the mock taxonomy once per session.
+    
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+        
+    Returns:
+        Path to a taxonomy directory containing test_taxonomy.json.
+    """
+    taxonomy_dir = tmp_path_factory.mktemp("taxonomy_session")
+    (taxonomy_dir / "test_taxonomy.json").write_text(
+        json.dumps(MOCK_TAXONOMY_DATA, indent=2)
+    )
+    return taxonomy_dir
+
+
 class TestGapAnalysisWorkflow:
     """End-to-end tests for gap analysis workflow."""
     
@@ -66,38 +103,9 @@ class TestGapAnalysisWorkflow:
         # Covered topics should not exceed total
         assert result.covered_topics <= result.total_topics
     
-    def test_analysis_with_mock_knowledge(self, mock_knowledge_dir, tmp_path):
+    def test_analysis_with_mock_knowledge(self, mock_knowledge_dir, session_mock_taxonomy_dir):
         """Test analysis with controlled mock knowledge."""
-        # Create minimal taxonomy for controlled testing
-        taxonomy_data = {
-            "domains": {
-                "test_domain": {
-                    "description": "Test domain",
-                    "required_depth": 2,
-                    "topics": {
-                        "covered_topic": {
-                            "description": "A topic that is covered",
-                            "keywords": ["test", "pattern"],
-                            "required_depth": 1
-                        },
-                        "missing_topic": {
-                            "description": "A topic that is NOT covered",
-                            "keywords": ["xyznonexistent123"],
-                            "required_depth": 2
-                        }
-                    }
-                }
-            }
-        }
-        
-        taxonomy_dir = tmp_path / "taxonomy"
-        taxonomy_dir.mkdir()
-        (taxonomy_dir / "test_taxonomy.json").write_text(
-            json.dumps(taxonomy_data, indent=2)
-        )
-        
-        # Run analysis
-        analyzer = KnowledgeGapAnalyzer(mock_knowledge_dir, taxonomy_dir)
+        analyzer = KnowledgeGapAnalyzer(mock_knowledge_dir, session_mock_taxonomy_dir)
         result = analyzer.analyze("test_taxonomy.json")
         
         # Should find the missing topic as a gap
@@ -184,12 +192,10 @@ class TestExtensionCandidates:
 class TestRunGapAnalysisFunction:
     """Tests for the run_gap_analysis convenience function."""
     
-    def test_run_gap_analysis_default_dir(self):
+    def test_run_gap_analysis_default_dir(self, default_gap_analysis):
         """Test run_gap_analysis with default knowledge directory."""
         # Should use default knowledge/ dir relative to module
-        result = run_gap_analysis()
-        
-        assert isinstance(result, AnalysisResult)
+        assert isinstance(default_gap_analysis, AnalysisResult)
     
     def test_run_gap_analysis_custom_dir(self, knowledge_dir):
         """Test run_gap_analysis with custom directory."""
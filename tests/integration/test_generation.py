@@ -8,346 +8,199 @@ Tests cover:
 - Multi-blueprint generation consistency
 """
 
-import sys
-from pathlib import Path
+import os
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import pytest
 
-from scripts.generate_project import ProjectConfig, ProjectGenerator
+from scripts.generate_project import ProjectGenerator
 
 
 class TestFullProjectGeneration:
     """Tests for complete project generation."""
     
-    def test_generate_creates_complete_structure(self, temp_output_dir):
-        """Test that generation creates complete directory structure."""
-        config = ProjectConfig(
-            project_name="complete-structure-test",
-            project_description="Testing complete structure",
-            primary_language="python",
-            agents=["code-reviewer"],
-            skills=["bugfix-workflow"],
-            triggers=["jira", "confluence"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
-        
-        assert result["success"]
-        
-        # Verify directory structure
-        expected_dirs = [
-            ".cursor/agents",
-            ".cursor/skills",
-            "knowledge",
-            "templates",
-            "workflows",
-            "scripts",
-            "diagrams",
-            "docs",
-            "src"
-        ]
-        
-        for dir_path in expected_dirs:
-            assert (temp_output_dir / dir_path).exists(), f"Missing directory: {dir_path}"
-    
-    def test_generate_creates_cursorrules(self, temp_output_dir):
-        """Test that .cursorrules is created with correct content."""
-        config = ProjectConfig(
-            project_name="cursorrules-test",
-            project_description="Testing cursorrules generation",
-            domain="testing-domain",
-            primary_language="typescript",
-            style_guide="google"
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
-        
-        assert result["success"]
-        
-        cursorrules_path = temp_output_dir / ".cursorrules"
-        assert cursorrules_path.exists()
-        
-        content = cursorrules_path.read_text(encoding='utf-8')
-        assert "cursorrules-test" in content
-        assert "Testing cursorrules generation" in content
-        assert "typescript" in content
-        assert "testing-domain" in content
-    
-    def test_generate_creates_readme(self, temp_output_dir):
-        """Test that README.md is created with correct content."""
-        config = ProjectConfig(
-            project_name="readme-test-project",
-            project_description="Testing README generation",
-            domain="readme-domain"
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
-        
-        assert result["success"]
-        
-        readme_path = temp_output_dir / "README.md"
-        assert readme_path.exists()
-        
-        content = readme_path.read_text(encoding='utf-8')
-        assert "readme-test-project" in content
-        assert "Testing README generation" in content
-    
-    def test_generate_creates_agents(self, temp_output_dir):
+    def test_generation_succeeds(self, generated_full_project):
+        """Test that full-featured generation reports success."""
+        _, result = generated_full_project
+        
+        assert result["success"]
+    
+    @pytest.mark.parametrize("relpath", [
+        ".cursor/agents",
+        ".cursor/skills",
+        "knowledge",
+        "templates",
+        "workflows",
+        "scripts",
+        "diagrams",
+        "docs",
+        "src",
+        ".cursorrules",
+        "README.md",
+    ])
+    def test_path_exists(self, generated_full_project, relpath):
+        """Test that generation creates the expected directories and files."""
+        output_dir, _ = generated_full_project
+        
+        assert (output_dir / relpath).exists(), f"Missing path: {relpath}"
+    
+    @pytest.mark.parametrize("relpath,must_contain", [
+        (".cursorrules", "complete-structure-test"),
+        (".cursorrules", "Testing complete structure"),
+        (".cursorrules", "typescript"),
+        (".cursorrules", "testing-domain"),
+        ("README.md", "complete-structure-test"),
+        ("README.md", "Testing complete structure"),
+    ])
+    def test_file_contains(self, generated_full_contents, relpath, must_contain):
+        """Test that generated files carry the configured project details."""
+        content = generated_full_contents[relpath]
+        assert must_contain in content, f"{relpath} should mention {must_contain!r}"
+    
+    @pytest.mark.parametrize("agent", ["code-reviewer", "test-generator"])
+    def test_generate_creates_agents(self, generated_full_project, agent):
         """Test that agent files are created when specified."""
-        config = ProjectConfig(
-            project_name="agents-test",
-            agents=["code-reviewer", "test-generator"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_full_project
         
         assert result["success"]
-        
-        agents_dir = temp_output_dir / ".cursor" / "agents"
-        assert agents_dir.exists()
-        
-        # Check that agent files were created
-        agent_files = list(agents_dir.glob("*.md"))
-        assert len(agent_files) > 0
+        assert (output_dir / ".cursor" / "agents" / f"{agent}.md").exists()
     
-    def test_generate_creates_skills(self, temp_output_dir):
+    @pytest.mark.parametrize("skill", ["bugfix-workflow", "tdd"])
+    def test_generate_creates_skills(self, generated_full_project, skill):
         """Test that skill files are created when specified."""
-        config = ProjectConfig(
-            project_name="skills-test",
-            skills=["bugfix-workflow", "tdd"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_full_project
         
         assert result["success"]
-        
-        skills_dir = temp_output_dir / ".cursor" / "skills"
-        assert skills_dir.exists()
-        
-        # Check that skill directories were created
-        skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir()]
-        assert len(skill_dirs) > 0
+        assert (output_dir / ".cursor" / "skills" / skill / "SKILL.md").exists()
 
 
 class TestBlueprintGeneration:
     """Tests for blueprint-based generation."""
     
-    def test_python_fastapi_blueprint_generation(self, temp_output_dir):
+    def test_python_fastapi_blueprint_generation(self, generated_fastapi_blueprint):
         """Test generation from python-fastapi blueprint."""
-        config = ProjectConfig(
-            project_name="fastapi-test",
-            project_description="FastAPI test project",
-            primary_language="python",
-            blueprint_id="python-fastapi",
-            agents=["code-reviewer"],
-            skills=["bugfix-workflow", "tdd"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_fastapi_blueprint
         
         assert result["success"]
-        assert (temp_output_dir / ".cursorrules").exists()
-        assert (temp_output_dir / "README.md").exists()
+        assert (output_dir / ".cursorrules").exists()
+        assert (output_dir / "README.md").exists()
     
-    def test_blueprint_generates_knowledge_files(self, temp_output_dir, factory_root):
+    def test_blueprint_generates_knowledge_files(self, generated_fastapi_blueprint):
         """Test that knowledge files are copied from factory."""
-        config = ProjectConfig(
-            project_name="knowledge-test",
-            blueprint_id="python-fastapi"
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_fastapi_blueprint
         
         assert result["success"]
         
-        knowledge_dir = temp_output_dir / "knowledge"
+        knowledge_dir = output_dir / "knowledge"
         assert knowledge_dir.exists()
         
         # Check that some knowledge files exist
-        knowledge_files = list(knowledge_dir.glob("*.json"))
-        assert len(knowledge_files) > 0
+        assert next(knowledge_dir.glob("*.json"), None) is not None
 
 
 class TestGeneratedContentValidation:
     """Tests for validating generated file contents."""
     
-    def test_agent_markdown_has_frontmatter(self, temp_output_dir):
+    @pytest.mark.parametrize("agent", ["code-reviewer", "test-generator"])
+    def test_agent_markdown_has_frontmatter(self, generated_full_contents, agent):
         """Test that generated agent files have YAML frontmatter."""
-        config = ProjectConfig(
-            project_name="frontmatter-test",
-            agents=["code-reviewer"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
-        
-        assert result["success"]
+        agent_file = f".cursor/agents/{agent}.md"
+        assert agent_file in generated_full_contents, f"Missing agent file: {agent_file}"
+        content = generated_full_contents[agent_file]
         
-        agents_dir = temp_output_dir / ".cursor" / "agents"
-        agent_files = list(agents_dir.glob("*.md"))
-        
-        for agent_file in agent_files:
-            content = agent_file.read_text(encoding='utf-8')
-            assert content.startswith("---"), f"Agent {agent_file} should start with frontmatter"
-            assert content.count("---") >= 2, f"Agent {agent_file} should have closing frontmatter"
+        assert content.startswith("---"), f"Agent {agent_file} should start with frontmatter"
+        assert content.count("---") >= 2, f"Agent {agent_file} should have closing frontmatter"
     
-    def test_skill_markdown_has_process_section(self, temp_output_dir):
+    @pytest.mark.parametrize("skill", ["bugfix-workflow", "tdd"])
+    def test_skill_markdown_has_process_section(self, generated_full_contents, skill):
         """Test that generated skill files have process section."""
-        config = ProjectConfig(
-            project_name="process-test",
-            skills=["bugfix-workflow"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        skill_file = f".cursor/skills/{skill}/SKILL.md"
+        assert skill_file in generated_full_contents, f"Missing skill file: {skill_file}"
+        content = generated_full_contents[skill_file]
         
-        assert result["success"]
-        
-        skills_dir = temp_output_dir / ".cursor" / "skills"
-        
-        for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir():
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    content = skill_file.read_text(encoding='utf-8')
-                    assert "## Process" in content or "## When to Use" in content
+        assert "## Process" in content or "## When to Use" in content
     
-    def test_cursorrules_has_mcp_section_when_configured(self, temp_output_dir):
+    def test_cursorrules_has_mcp_section_when_configured(self, generated_mcp_project,
+                                                         generated_mcp_contents):
         """Test that .cursorrules has MCP section when servers configured."""
-        config = ProjectConfig(
-            project_name="mcp-test",
-            mcp_servers=[
-                {"name": "atlassian", "url": "https://mcp.atlassian.com", "purpose": "Jira"},
-                {"name": "deepwiki", "url": "https://deepwiki.com", "purpose": "GitHub"}
-            ]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        _, result = generated_mcp_project
         
         assert result["success"]
         
-        cursorrules_path = temp_output_dir / ".cursorrules"
-        content = cursorrules_path.read_text(encoding='utf-8')
+        content = generated_mcp_contents[".cursorrules"]
         
         assert "atlassian" in content
         assert "deepwiki" in content
     
-    def test_templates_are_created(self, temp_output_dir):
+    def test_templates_are_created(self, generated_minimal_project):
         """Test that template files are created."""
-        config = ProjectConfig(
-            project_name="templates-test"
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_minimal_project
         
         assert result["success"]
         
-        templates_dir = temp_output_dir / "templates"
-        template_files = list(templates_dir.glob("*.md"))
+        templates_dir = output_dir / "templates"
         
-        assert len(template_files) > 0, "Template files should be created"
+        assert next(templates_dir.glob("*.md"), None) is not None, \
+            "Template files should be created"
 
 
 class TestWorkflowGeneration:
     """Tests for workflow file generation."""
     
-    def test_workflows_readme_created(self, temp_output_dir):
+    def test_workflows_readme_created(self, generated_jira_project):
         """Test that workflows README is created."""
-        config = ProjectConfig(
-            project_name="workflow-readme-test",
-            triggers=["jira"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_jira_project
         
         assert result["success"]
         
-        workflows_readme = temp_output_dir / "workflows" / "README.md"
+        workflows_readme = output_dir / "workflows" / "README.md"
         assert workflows_readme.exists()
     
-    def test_bugfix_workflow_created_with_jira_trigger(self, temp_output_dir):
+    def test_bugfix_workflow_created_with_jira_trigger(self, generated_jira_project):
         """Test that bugfix workflow is created when jira trigger is specified."""
-        config = ProjectConfig(
-            project_name="bugfix-workflow-test",
-            triggers=["jira"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_jira_project
         
         assert result["success"]
         
-        bugfix_workflow = temp_output_dir / "workflows" / "bugfix_workflow.md"
+        bugfix_workflow = output_dir / "workflows" / "bugfix_workflow.md"
         assert bugfix_workflow.exists()
     
-    def test_feature_workflow_created_with_confluence_trigger(self, temp_output_dir):
+    def test_feature_workflow_created_with_confluence_trigger(self, generated_confluence_project):
         """Test that feature workflow is created when confluence trigger is specified."""
-        config = ProjectConfig(
-            project_name="feature-workflow-test",
-            triggers=["confluence"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        output_dir, result = generated_confluence_project
         
         assert result["success"]
         
-        feature_workflow = temp_output_dir / "workflows" / "feature_workflow.md"
+        feature_workflow = output_dir / "workflows" / "feature_workflow.md"
         assert feature_workflow.exists()
 
 
 class TestGenerationErrors:
     """Tests for error handling during generation."""
     
-    def test_missing_agent_pattern_warning(self, temp_output_dir, capsys):
-        """Test that missing agent patterns are handled gracefully."""
-        config = ProjectConfig(
-            project_name="missing-agent-test",
-            agents=["nonexistent-agent"]
-        )
-        
-        generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
-        
-        # Should still succeed but with warning
-        assert result["success"]
-        
-        # The nonexistent agent should not create a file
-        agents_dir = temp_output_dir / ".cursor" / "agents"
-        agent_files = list(agents_dir.glob("nonexistent-agent.md"))
-        assert len(agent_files) == 0
-    
-    def test_missing_skill_pattern_warning(self, temp_output_dir, capsys):
-        """Test that missing skill patterns are handled gracefully."""
-        config = ProjectConfig(
-            project_name="missing-skill-test",
-            skills=["nonexistent-skill"]
-        )
+    @pytest.mark.parametrize("kind,name", [
+        ("agents", "nonexistent-agent"),
+        ("skills", "nonexistent-skill"),
+    ])
+    def test_missing_pattern_warning(self, make_config, temp_output_dir, kind, name):
+        """Test that missing agent/skill patterns are handled gracefully."""
+        config = make_config(project_name=f"missing-{kind}-test", **{kind: [name]})
         
         generator = ProjectGenerator(config, str(temp_output_dir))
-        result = generator.generate()
+        # Only the agent/skill step is relevant; skip the rest of generate()
+        getattr(generator, f"_generate_{kind}")(None)
         
-        # Should still succeed but with warning
-        assert result["success"]
+        # Should still succeed (no errors) but create nothing
+        assert generator.errors == []
+        assert generator.generated_files == []
+        assert not (temp_output_dir / ".cursor" / kind).exists()
 
 
 class TestFileTracking:
     """Tests for file tracking during generation."""
     
-    def test_all_files_tracked(self, temp_output_dir):
+    def test_all_files_tracked(self, make_config, temp_output_dir):
         """Test that all generated files are tracked."""
-        config = ProjectConfig(
+        config = make_config(
             project_name="tracking-test",
             agents=["code-reviewer"],
             skills=["bugfix-workflow"],
@@ -359,13 +212,13 @@ class TestFileTracking:
         
         assert result["success"]
         
-        # All tracked files should exist
-        for file_path in result["files_created"]:
-            assert Path(file_path).exists(), f"Tracked file {file_path} should exist"
+        # All tracked files should exist; report every missing one at once
+        missing = [p for p in result["files_created"] if not os.path.lexists(p)]
+        assert not missing, f"Missing tracked files: {missing}"
     
-    def test_file_count_matches_tracked(self, temp_output_dir):
+    def test_file_count_matches_tracked(self, make_config, temp_output_dir):
         """Test that file count matches tracked files."""
-        config = ProjectConfig(
+        config = make_config(
             project_name="count-test",
             agents=["code-reviewer"],
             skills=["bugfix-workflow"]
@@ -5,17 +5,13 @@ These tests simulate actual operations and verify the Guardian
 actually PREVENTS harmful actions, not just detects them.
 """
 
+import functools
 import pytest
-import sys
 import tempfile
 import os
-from pathlib import Path
-from typing import Tuple, Optional, Callable
+from typing import Dict, Iterator, List, Tuple, Optional, Callable
 from dataclasses import dataclass
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-
 from guardian.axiom_checker import check_command, check_file_operation, validate_operation
 from guardian.secret_scanner import scan_content, get_severity_level
 from guardian.harm_detector import comprehensive_check, analyze_file_operation
@@ -25,7 +21,7 @@ from guardian.harm_detector import comprehensive_check, analyze_file_operation
 # SIMULATED AGENT THAT USES GUARDIAN
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentAction:
     """Represents an action the agent wants to take."""
     action_type: str  # 'command', 'file_write', 'file_delete'
@@ -33,14 +29,92 @@ class AgentAction:
     content: Optional[str] = None  # file content if applicable
 
 
-@dataclass 
+@dataclass(frozen=True, slots=True)
 class GuardedResult:
     """Result of a Guardian-protected action."""
     allowed: bool
     level: int
     action_taken: bool
     message: str
-    would_have_done: str  # What would have happened without Guardian
+    # What would have happened without Guardian, formatted only when read
+    _template: str
+    _target: str
+    
+    @property
+    def would_have_done(self) -> str:
+        """Description of the action the Guardian intercepted."""
+        return self._template.format(self._target)
+
+
+@dataclass(frozen=True, slots=True)
+class _Check:
+    """Guardian verdict for one action, shared between memoized calls."""
+    passed: bool
+    level: int
+    message: Optional[str]
+
+
+# Guardian message per level: (without, with) user confirmation.
+# Levels 0-1 proceed on their own, 2-3 need the user's confirmation and
+# level 4 is always blocked, even if the user confirms.
+_LEVEL_MESSAGES = {
+    0: ("Action aligned with axioms", "Action aligned with axioms"),  # Flow
+    1: ("Minor adjustment made", "Minor adjustment made"),  # Nudge
+    2: ("Paused - awaiting user confirmation", "User confirmed, proceeding"),  # Pause
+    3: ("Blocked - clear axiom violation", "User explicitly overrode block"),  # Block
+    4: ("Protected - imminent harm prevented", "Protected - imminent harm prevented"),  # Protect
+}
+
+
+def _check_command(target: str, content: Optional[str]) -> _Check:
+    """Guardian check for running a shell command."""
+    check = validate_operation('command', {'command': target})
+    return _Check(check.passed, check.level, check.message)
+
+
+def _check_file_write(target: str, content: Optional[str]) -> _Check:
+    """Guardian check for writing a file; covers both path and content."""
+    report = analyze_file_operation('write', target, content)
+    return _Check(report.safe, report.level, report.summary)
+
+
+def _check_file_delete(target: str, content: Optional[str]) -> _Check:
+    """Guardian check for deleting a file."""
+    check = validate_operation('file_delete', {'path': target})
+    return _Check(check.passed, check.level, check.message)
+
+
+# Per action type: the Guardian check to run and what the action would
+# have done without the Guardian
+_HANDLERS: Dict[str, Tuple[Callable[[str, Optional[str]], _Check], str]] = {
+    'command': (_check_command, "Executed: {}"),
+    'file_write': (_check_file_write, "Written to: {}"),
+    'file_delete': (_check_file_delete, "Deleted: {}"),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_check(
+    action_type: str,
+    target: str,
+    content: Optional[str]
+) -> _Check:
+    """
+    Run the Guardian check for one action, memoized on its inputs.
+    
+    The Guardian checks are pure functions of these strings, so repeated
+    actions (e.g. the same command across tests) are checked only once.
+    
+    Args:
+        action_type: 'command', 'file_write' or 'file_delete'
+        target: Command string or file path
+        content: File content for writes, otherwise None
+        
+    Returns:
+        _Check with the Guardian's verdict
+    """
+    check, _ = _HANDLERS[action_type]
+    return check(target, content)
 
 
 class GuardedAgent:
@@ -51,10 +125,19 @@ class GuardedAgent:
     to decide whether to proceed with an action.
     """
     
-    def __init__(self):
-        self.actions_blocked = []
-        self.actions_allowed = []
-        self.user_confirmations = []
+    def __init__(self, stats_only: bool = False) -> None:
+        """
+        Args:
+            stats_only: Keep only counts, not the actions themselves
+        """
+        self.stats_only = stats_only
+        self.blocked_count = 0
+        self.allowed_count = 0
+        self.confirmed_count = 0
+        # Stay empty in stats-only mode; execute_with_guardian skips the appends
+        self.actions_blocked: List[AgentAction] = []
+        self.actions_allowed: List[AgentAction] = []
+        self.user_confirmations: List[AgentAction] = []
     
     def execute_with_guardian(
         self, 
@@ -72,105 +155,56 @@ class GuardedAgent:
             GuardedResult with outcome
         """
         # Check with Guardian
-        if action.action_type == 'command':
-            check = validate_operation('command', {'command': action.target})
-            would_have_done = f"Executed: {action.target}"
-            
-        elif action.action_type == 'file_write':
-            # Check both the file operation and content
-            report = analyze_file_operation('write', action.target, action.content)
-            check = type('Check', (), {
-                'passed': report.safe,
-                'level': report.level,
-                'message': report.summary
-            })()
-            would_have_done = f"Written to: {action.target}"
-            
-        elif action.action_type == 'file_delete':
-            check = validate_operation('file_delete', {'path': action.target})
-            would_have_done = f"Deleted: {action.target}"
-        else:
-            raise ValueError(f"Unknown action type: {action.action_type}")
+        try:
+            _, template = _HANDLERS[action.action_type]
+        except KeyError:
+            raise ValueError(f"Unknown action type: {action.action_type}") from None
+        
+        level = _cached_check(action.action_type, action.target, action.content).level
         
         # Apply Guardian decision
-        level = check.level
-        
-        if level == 0:
-            # Level 0: Flow - proceed normally
-            self.actions_allowed.append(action)
-            return GuardedResult(
-                allowed=True,
-                level=0,
-                action_taken=True,
-                message="Action aligned with axioms",
-                would_have_done=would_have_done
-            )
-            
-        elif level == 1:
-            # Level 1: Nudge - proceed with self-correction
-            self.actions_allowed.append(action)
-            return GuardedResult(
-                allowed=True,
-                level=1,
-                action_taken=True,
-                message="Minor adjustment made",
-                would_have_done=would_have_done
-            )
-            
-        elif level == 2:
-            # Level 2: Pause - requires user confirmation
-            if user_confirms:
+        level = min(level, 4)
+        confirmed = user_confirms and level in (2, 3)
+        allowed = level < 2 or confirmed
+        
+        self.allowed_count += allowed
+        self.blocked_count += not allowed
+        self.confirmed_count += confirmed
+        if not self.stats_only:
+            if confirmed:
                 self.user_confirmations.append(action)
+            if allowed:
                 self.actions_allowed.append(action)
-                return GuardedResult(
-                    allowed=True,
-                    level=2,
-                    action_taken=True,
-                    message="User confirmed, proceeding",
-                    would_have_done=would_have_done
-                )
             else:
                 self.actions_blocked.append(action)
-                return GuardedResult(
-                    allowed=False,
-                    level=2,
-                    action_taken=False,
-                    message="Paused - awaiting user confirmation",
-                    would_have_done=would_have_done
-                )
-                
-        elif level == 3:
-            # Level 3: Block - requires explicit user override
-            if user_confirms:
-                self.user_confirmations.append(action)
-                self.actions_allowed.append(action)
-                return GuardedResult(
-                    allowed=True,
-                    level=3,
-                    action_taken=True,
-                    message="User explicitly overrode block",
-                    would_have_done=would_have_done
-                )
-            else:
-                self.actions_blocked.append(action)
-                return GuardedResult(
-                    allowed=False,
-                    level=3,
-                    action_taken=False,
-                    message="Blocked - clear axiom violation",
-                    would_have_done=would_have_done
-                )
-                
-        else:  # level >= 4
-            # Level 4: Protect - ALWAYS block, even with user confirmation
-            self.actions_blocked.append(action)
-            return GuardedResult(
-                allowed=False,
-                level=4,
-                action_taken=False,
-                message="Protected - imminent harm prevented",
-                would_have_done=would_have_done
-            )
+        
+        unconfirmed_message, confirmed_message = _LEVEL_MESSAGES[level]
+        
+        return GuardedResult(
+            allowed=allowed,
+            level=level,
+            action_taken=allowed,
+            message=confirmed_message if confirmed else unconfirmed_message,
+            _template=template,
+            _target=action.target
+        )
+    
+    def execute_many(
+        self,
+        actions: List[AgentAction],
+        user_confirms: bool = False
+    ) -> List[GuardedResult]:
+        """
+        Execute a batch of actions with Guardian protection, in order.
+        
+        Args:
+            actions: The actions to execute
+            user_confirms: Whether user confirmed (for Level 2-3)
+            
+        Returns:
+            One GuardedResult per action
+        """
+        return [self.execute_with_guardian(action, user_confirms) for action in actions]
 
 
 # =============================================================================
@@ -245,6 +279,26 @@ class TestGuardianActuallyPreventsHarm:
         
         assert len(agent.actions_allowed) == 3, "All safe actions should be allowed"
         assert len(agent.actions_blocked) == 0, "No safe actions should be blocked"
+    
+    def test_stats_only_agent_counts_without_storing(self):
+        """Stats-only agents track outcomes as counts, not action lists."""
+        agent = GuardedAgent(stats_only=True)
+        
+        agent.execute_with_guardian(AgentAction('command', 'ls -la'))
+        agent.execute_with_guardian(AgentAction('command', 'rm -rf /'))
+        agent.execute_with_guardian(
+            AgentAction('file_write', '.env', 'DEBUG=true'), user_confirms=True
+        )
+        
+        assert (agent.allowed_count, agent.blocked_count, agent.confirmed_count) == (2, 1, 1)
+        assert agent.actions_allowed == agent.actions_blocked == agent.user_confirmations == []
+    
+    def test_unknown_action_type_rejected(self):
+        """Actions the Guardian has no check for are refused outright."""
+        agent = GuardedAgent()
+        
+        with pytest.raises(ValueError, match="Unknown action type"):
+            agent.execute_with_guardian(AgentAction('network_call', 'https://example.com'))
 
 
 class TestGuardianPauseRequiresConfirmation:
@@ -345,30 +399,46 @@ class TestGuardianPreCommitScenario:
         """Set up test fixtures."""
         self.files_to_commit = []
     
-    def simulate_pre_commit(self, files: dict) -> Tuple[bool, list]:
+    def _iter_issues(self, files: dict) -> Iterator[dict]:
         """
-        Simulate a pre-commit hook that uses Guardian.
+        Lazily scan files and yield one issue per blocking file.
         
         Args:
             files: Dict of {filename: content}
             
-        Returns:
-            (allowed, list of issues)
+        Yields:
+            Issue dicts for files at Level 3 or above
         """
-        issues = []
-        
         for filename, content in files.items():
             # Scan content for secrets
             matches = scan_content(content)
             level = get_severity_level(matches)
             
             if level >= 3:
-                issues.append({
+                yield {
                     'file': filename,
                     'level': level,
                     'secrets': [m.pattern_name for m in matches]
-                })
+                }
+    
+    def simulate_pre_commit(self, files: dict, fast_fail: bool = False) -> Tuple[bool, list]:
+        """
+        Simulate a pre-commit hook that uses Guardian.
         
+        Args:
+            files: Dict of {filename: content}
+            fast_fail: Stop scanning at the first blocking file
+            
+        Returns:
+            (allowed, list of issues)
+        """
+        issues = self._iter_issues(files)
+        
+        if fast_fail:
+            first = next(issues, None)
+            return first is None, [] if first is None else [first]
+        
+        issues = list(issues)
         return len(issues) == 0, issues
     
     def test_commit_with_secrets_blocked(self):
@@ -398,6 +468,19 @@ class TestGuardianPreCommitScenario:
         assert allowed, "Clean commit should be allowed"
         assert len(issues) == 0
     
+    def test_fast_fail_stops_at_first_blocking_file(self):
+        """Fast-fail mode reports only the first file with secrets."""
+        files = {
+            'main.py': 'print("hello")',
+            'config.py': 'API_KEY = "sk-1234567890abcdefghijklmnopqrstuv"',
+            'settings.py': 'password = "supersecretpassword123"',
+        }
+        
+        allowed, issues = self.simulate_pre_commit(files, fast_fail=True)
+        
+        assert not allowed, "Commit with secrets must be blocked"
+        assert [issue['file'] for issue in issues] == ['config.py']
+    
     def test_env_file_in_commit_blocked(self):
         """Committing .env content should be blocked."""
         files = {
@@ -417,7 +500,7 @@ class TestGuardianStatistics:
     
     def test_guardian_blocking_rate(self):
         """Measure what percentage of harmful actions are blocked."""
-        agent = GuardedAgent()
+        agent = GuardedAgent(stats_only=True)
         
         harmful_actions = [
             AgentAction('command', 'rm -rf /'),
@@ -427,12 +510,9 @@ class TestGuardianStatistics:
             AgentAction('command', 'format C:'),
         ]
         
-        blocked = 0
-        for action in harmful_actions:
-            result = agent.execute_with_guardian(action)
-            if not result.action_taken:
-                blocked += 1
+        agent.execute_many(harmful_actions)
         
+        blocked = agent.blocked_count
         blocking_rate = blocked / len(harmful_actions)
         
         # We expect 100% blocking rate for Level 4 actions
@@ -441,7 +521,7 @@ class TestGuardianStatistics:
     
     def test_guardian_false_positive_rate(self):
         """Measure false positive rate on safe actions."""
-        agent = GuardedAgent()
+        agent = GuardedAgent(stats_only=True)
         
         safe_actions = [
             AgentAction('command', 'ls -la'),
@@ -454,12 +534,9 @@ class TestGuardianStatistics:
             AgentAction('command', 'mkdir new_folder'),
         ]
         
-        false_positives = 0
-        for action in safe_actions:
-            result = agent.execute_with_guardian(action)
-            if not result.action_taken:
-                false_positives += 1
+        agent.execute_many(safe_actions)
         
+        false_positives = agent.blocked_count
         fp_rate = false_positives / len(safe_actions)
         
         # We expect very low false positive rate
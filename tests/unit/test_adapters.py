@@ -11,13 +11,11 @@ Author: Cursor Agent Factory
 Version: 1.0.0
 """
 
+import hashlib
+import json
 import pytest
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from adapters.base_adapter import (
     BaseAdapter,
@@ -155,6 +153,37 @@ class TestKnowledgeUpdate:
         assert update.checksum is not None
         assert len(update.checksum) == 64  # SHA-256 hex
     
+    def test_checksum_matches_sorted_json(self):
+        """Test that checksum is SHA-256 of the key-sorted JSON content."""
+        source = UpdateSource(adapter_type="test", identifier="test")
+        content = {"b": [1, 2], "a": {"nested": "väl"}}
+        
+        update = KnowledgeUpdate(
+            target_file="test.json",
+            priority=UpdatePriority.LOW,
+            source=source,
+            changes=[],
+            new_version="1.0.0",
+            proposed_content=content
+        )
+        
+        expected = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        assert update.checksum == expected
+    
+    def test_checksum_skipped_without_content(self):
+        """Test that no checksum is computed when there is no content."""
+        source = UpdateSource(adapter_type="test", identifier="test")
+        
+        update = KnowledgeUpdate(
+            target_file="test.json",
+            priority=UpdatePriority.LOW,
+            source=source,
+            changes=[],
+            new_version="1.0.0"
+        )
+        
+        assert update.checksum is None
+    
     def test_to_dict(self):
         """Test serialization to dictionary."""
         source = UpdateSource(adapter_type="github", identifier="test/repo")
@@ -265,6 +294,33 @@ class TestBaseAdapter:
         cached = adapter._get_cached("test_key")
         assert cached == {"data": "test"}
     
+    def test_cache_expires_after_ttl(self):
+        """Test that entries older than the TTL are refreshed and dropped."""
+        config = AdapterConfig(cache_ttl_hours=1)
+        adapter = ConcreteAdapter(config)
+        
+        with patch("adapters.base_adapter.time.monotonic", return_value=1000.0):
+            adapter._set_cached("test_key", "data")
+        
+        with patch("adapters.base_adapter.time.monotonic", return_value=1000.0 + 3601):
+            assert adapter._get_cached("test_key") is None
+        
+        assert adapter._should_refresh_cache("test_key") is True
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within cache_max_entries."""
+        config = AdapterConfig(cache_max_entries=2)
+        adapter = ConcreteAdapter(config)
+        
+        adapter._set_cached("a", 1)
+        adapter._set_cached("b", 2)
+        adapter._get_cached("a")  # "b" is now least recently used
+        adapter._set_cached("c", 3)
+        
+        assert adapter._get_cached("a") == 1
+        assert adapter._get_cached("b") is None
+        assert adapter._get_cached("c") == 3
+    
     def test_repr(self):
         """Test string representation."""
         config = AdapterConfig(enabled=True)
@@ -4,17 +4,15 @@ Unit tests for scripts/backup_manager.py
 Tests backup creation, manifest management, and rollback functionality.
 """
 
+import hashlib
 import json
 import sys
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.backup_manager import (
     BackupEntry,
     BackupManifest,
@@ -24,6 +22,12 @@ from scripts.backup_manager import (
 )
 
 
+@pytest.fixture
+def manager(tmp_path):
+    """BackupManager for a fresh temporary repository."""
+    return BackupManager(tmp_path)
+
+
 class TestBackupEntry:
     """Tests for BackupEntry dataclass."""
     
@@ -141,416 +145,553 @@ class TestBackupManifest:
 class TestBackupSession:
     """Tests for BackupSession class."""
     
-    def test_session_creation(self):
+    def test_session_creation(self, manager):
         """Test creating a backup session."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            session = BackupSession(manager, "test_session", "Test description")
-            
-            assert session.session_id == "test_session"
-            assert session.manifest.description == "Test description"
-            assert session.session_dir.exists()
+        session = BackupSession(manager, "test_session", "Test description")
+        
+        assert session.session_id == "test_session"
+        assert session.manifest.description == "Test description"
+        assert session.session_dir.exists()
     
-    def test_backup_file_existing(self):
+    def test_backup_file_existing(self, manager):
         """Test backing up an existing file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # Create a file to backup
-            test_file = repo_path / "test.txt"
-            test_file.write_text("Original content")
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            
-            result = session.backup_file(test_file)
-            
-            assert result is True
-            assert len(session.manifest.entries) == 1
-            assert session.manifest.entries[0].original_path == "test.txt"
-            assert session.manifest.entries[0].was_new is False
-            assert session.manifest.entries[0].file_hash != ""
+        repo_path = manager.repo_path
+        
+        # Create a file to backup
+        test_file = repo_path / "test.txt"
+        test_file.write_text("Original content")
+        
+        session = manager.create_session("Test")
+        
+        result = session.backup_file(test_file)
+        
+        assert result is True
+        assert len(session.manifest.entries) == 1
+        assert session.manifest.entries[0].original_path == "test.txt"
+        assert session.manifest.entries[0].was_new is False
+        assert session.manifest.entries[0].file_hash != ""
+    
+    @pytest.mark.parametrize("content", [b"Original content", b""])
+    @pytest.mark.parametrize("file_digest_available", [True, False])
+    def test_backup_file_hash_matches_content(self, manager, monkeypatch, content, file_digest_available):
+        """Test that the recorded hash is the MD5 of the file content."""
+        if not file_digest_available:
+            # Exercise the mmap fallback used before Python 3.11
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        
+        repo_path = manager.repo_path
+        
+        test_file = repo_path / "test.txt"
+        test_file.write_bytes(content)
+        
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        
+        assert session.manifest.entries[0].file_hash == hashlib.md5(content).hexdigest()
+    
+    def test_backup_file_skips_already_backed_up_path(self, manager):
+        """Test that a second backup of a path keeps the original copy."""
+        repo_path = manager.repo_path
+        test_file = repo_path / "test.txt"
+        test_file.write_text("Original content")
+        
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        test_file.write_text("Modified content")
+        
+        with patch("scripts.backup_manager._hash_file") as mock_hash:
+            assert session.backup_file(test_file) is True
+        
+        mock_hash.assert_not_called()
+        assert len(session.manifest.entries) == 1
+        entry = session.manifest.entries[0]
+        assert entry.size == len("Original content")
+        assert Path(entry.backup_path).read_text() == "Original content"
+    
+    def test_resumed_session_skips_already_backed_up_path(self, manager):
+        """Test that a session resumed with get_session keeps the original copy."""
+        test_file = manager.repo_path / "test.txt"
+        test_file.write_text("Original content")
+        
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        test_file.write_text("Modified content")
+        
+        resumed = manager.get_session(session.session_id)
+        assert resumed.backup_file(test_file) is True
+        
+        assert len(resumed.manifest.entries) == 1
+        entry = resumed.manifest.entries[0]
+        assert Path(entry.backup_path).read_text() == "Original content"
+        
+        on_disk = json.loads((resumed.session_dir / "manifest.json").read_text())
+        assert on_disk["description"] == "Test"
+        assert [e["original_path"] for e in on_disk["entries"]] == [str(Path("test.txt"))]
+    
+    def test_backup_directory_skips_already_backed_up_files(self, manager):
+        """Test that directory backups do not duplicate earlier entries."""
+        repo_path = manager.repo_path
+        src = repo_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("a")
+        (src / "b.txt").write_text("b")
+        
+        session = manager.create_session("Test")
+        session.backup_file(src / "a.txt")
+        session.backup_directory(src)
+        
+        paths = sorted(e.original_path for e in session.manifest.entries)
+        assert paths == [str(Path("src/a.txt")), str(Path("src/b.txt"))]
     
-    def test_backup_file_marked_as_new(self):
+    def test_backup_file_marked_as_new(self, manager):
         """Test marking a file as newly created."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # File doesn't exist yet
-            new_file = repo_path / "new_file.txt"
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            
-            result = session.backup_file(new_file, mark_as_new=True)
-            
-            assert result is True
-            assert session.manifest.entries[0].was_new is True
-            assert session.manifest.entries[0].file_hash == ""
+        repo_path = manager.repo_path
+        
+        # File doesn't exist yet
+        new_file = repo_path / "new_file.txt"
+        
+        session = manager.create_session("Test")
+        
+        result = session.backup_file(new_file, mark_as_new=True)
+        
+        assert result is True
+        assert session.manifest.entries[0].was_new is True
+        assert session.manifest.entries[0].file_hash == ""
     
-    def test_backup_directory(self):
+    def test_backup_directory(self, manager):
         """Test backing up a directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # Create directory with files
-            subdir = repo_path / "subdir"
-            subdir.mkdir()
-            (subdir / "file1.txt").write_text("Content 1")
-            (subdir / "file2.txt").write_text("Content 2")
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            
-            result = session.backup_directory(subdir)
-            
-            assert result is True
-            assert len(session.manifest.entries) == 2
+        repo_path = manager.repo_path
+        
+        # Create directory with files
+        subdir = repo_path / "subdir"
+        subdir.mkdir()
+        (subdir / "file1.txt").write_text("Content 1")
+        (subdir / "file2.txt").write_text("Content 2")
+        
+        session = manager.create_session("Test")
+        
+        result = session.backup_directory(subdir)
+        
+        assert result is True
+        assert len(session.manifest.entries) == 2
     
-    def test_rollback_restores_files(self):
+    def test_rollback_restores_files(self, manager):
         """Test that rollback restores original file content."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # Create original file
-            test_file = repo_path / "test.txt"
-            test_file.write_text("Original content")
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            session.backup_file(test_file)
-            
-            # Modify the file
-            test_file.write_text("Modified content")
-            assert test_file.read_text() == "Modified content"
-            
-            # Rollback
-            result = session.rollback()
-            
-            assert result is True
-            assert test_file.read_text() == "Original content"
-            assert session.manifest.rolled_back is True
+        repo_path = manager.repo_path
+        
+        # Create original file
+        test_file = repo_path / "test.txt"
+        test_file.write_text("Original content")
+        
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        
+        # Modify the file
+        test_file.write_text("Modified content")
+        assert test_file.read_text() == "Modified content"
+        
+        # Rollback
+        result = session.rollback()
+        
+        assert result is True
+        assert test_file.read_text() == "Original content"
+        assert session.manifest.rolled_back is True
     
-    def test_rollback_deletes_new_files(self):
+    def test_rollback_deletes_new_files(self, manager):
         """Test that rollback deletes newly created files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # Mark a new file
-            new_file = repo_path / "new_file.txt"
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            session.backup_file(new_file, mark_as_new=True)
-            
-            # Create the new file
-            new_file.write_text("New file content")
-            assert new_file.exists()
-            
-            # Rollback should delete it
-            result = session.rollback()
-            
-            assert result is True
-            assert not new_file.exists()
+        repo_path = manager.repo_path
+        
+        # Mark a new file
+        new_file = repo_path / "new_file.txt"
+        
+        session = manager.create_session("Test")
+        session.backup_file(new_file, mark_as_new=True)
+        
+        # Create the new file
+        new_file.write_text("New file content")
+        assert new_file.exists()
+        
+        # Rollback should delete it
+        result = session.rollback()
+        
+        assert result is True
+        assert not new_file.exists()
     
-    def test_complete_marks_session_complete(self):
+    def test_complete_marks_session_complete(self, manager):
         """Test that complete() marks session as completed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            
-            assert session.manifest.completed is False
-            
-            session.complete()
-            
-            assert session.manifest.completed is True
+        session = manager.create_session("Test")
+        
+        assert session.manifest.completed is False
+        
+        session.complete()
+        
+        assert session.manifest.completed is True
+    
+    def test_backup_directory_writes_manifest_once(self, manager):
+        """Test that backing up a directory writes the manifest a single time."""
+        repo_path = manager.repo_path
+        src = repo_path / "src"
+        src.mkdir()
+        for name in ("a.txt", "b.txt"):
+            (src / name).write_text(name)
+        
+        session = manager.create_session("Test")
+        with patch.object(session, "_save_manifest", wraps=session._save_manifest) as save:
+            session.backup_directory(src)
+        
+        assert save.call_count == 1
+        data = json.loads((session.session_dir / "manifest.json").read_text())
+        assert len(data["entries"]) == 2
+    
+    def test_backup_directory_keeps_walk_order(self, manager):
+        """Test that parallel directory backups record entries in walk order."""
+        repo_path = manager.repo_path
+        src = repo_path / "src"
+        (src / "nested").mkdir(parents=True)
+        for i in range(12):
+            (src / ("nested" if i % 2 else ".") / f"f{i}.txt").write_text(str(i) * i)
+        
+        session = manager.create_session("Test")
+        
+        assert session.backup_directory(src)
+        
+        expected = [str(p.relative_to(repo_path)) for p in src.rglob("*") if p.is_file()]
+        assert [e.original_path for e in session.manifest.entries] == expected
+        for entry in session.manifest.entries:
+            assert Path(entry.backup_path).read_bytes() == (repo_path / entry.original_path).read_bytes()
 
 
 class TestBackupManager:
     """Tests for BackupManager class."""
     
-    def test_manager_creation(self):
+    def test_manager_creation(self, manager):
         """Test creating a BackupManager."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            assert manager.repo_path == repo_path
-            assert manager.backup_root == repo_path / ".cursor-factory-backup"
+        repo_path = manager.repo_path
+        
+        assert manager.repo_path == repo_path
+        assert manager.backup_root == repo_path / ".cursor-factory-backup"
     
-    def test_create_session(self):
+    def test_create_session(self, manager):
         """Test creating a backup session."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            session = manager.create_session("Test session")
-            
-            assert session is not None
-            assert session.manifest.description == "Test session"
-            assert manager.backup_root.exists()
+        session = manager.create_session("Test session")
+        
+        assert session is not None
+        assert session.manifest.description == "Test session"
+        assert manager.backup_root.exists()
+    
+    def test_create_session_ids_unique_within_same_second(self, manager):
+        """Test that sessions created in the same second do not collide."""
+        fixed = datetime(2024, 1, 1, 12, 0, 0)
+        with patch("scripts.backup_manager.datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed
+            ids = [manager.create_session(f"S{i}").session_id for i in range(3)]
+        
+        assert ids == ["20240101_120000", "20240101_120000_1", "20240101_120000_2"]
+        assert len(manager.list_sessions()) == 3
     
-    def test_list_sessions_empty(self):
+    def test_list_sessions_empty(self, manager):
         """Test listing sessions when none exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            sessions = manager.list_sessions()
-            
-            assert sessions == []
+        sessions = manager.list_sessions()
+        
+        assert sessions == []
     
-    def test_list_sessions_returns_manifests(self):
+    def test_list_sessions_returns_manifests(self, manager):
         """Test listing sessions returns manifest objects."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            # Create a few sessions
-            session1 = manager.create_session("Session 1")
-            session1.complete()
-            
-            sessions = manager.list_sessions()
-            
-            assert len(sessions) >= 1
-            assert any(s.description == "Session 1" for s in sessions)
+        # Create a few sessions
+        session1 = manager.create_session("Session 1")
+        session1.complete()
+        
+        sessions = manager.list_sessions()
+        
+        assert len(sessions) >= 1
+        assert any(s.description == "Session 1" for s in sessions)
+    
+    def test_list_sessions_reuses_unchanged_manifests(self, manager):
+        """Test that unchanged manifests are not parsed again."""
+        manager.create_session("Session 1")
+        
+        first = manager.list_sessions()
+        with patch("scripts.backup_manager._read_json") as mock_read:
+            second = manager.list_sessions()
+        
+        mock_read.assert_not_called()
+        assert second == first
     
-    def test_get_session_by_id(self):
+    def test_list_sessions_returns_independent_copies(self, manager):
+        """Test that modifying a listed manifest does not leak into later listings."""
+        manager.create_session("Session 1")
+        
+        listed = manager.list_sessions()[0]
+        listed.completed = True
+        listed.entries.append(
+            BackupEntry("a.txt", "backup/a.txt", "hash", "2024-01-01T00:00:00")
+        )
+        
+        relisted = manager.list_sessions()[0]
+        assert relisted is not listed
+        assert not relisted.completed
+        assert relisted.entries == []
+    
+    def test_list_sessions_sees_rewritten_manifest(self, manager):
+        """Test that a manifest rewritten after listing is parsed again."""
+        session = manager.create_session("Session 1")
+        
+        assert not manager.list_sessions()[0].completed
+        session.complete()
+        
+        assert manager.list_sessions()[0].completed
+    
+    def test_get_session_by_id(self, manager):
         """Test retrieving a session by ID."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            original = manager.create_session("Test")
-            session_id = original.session_id
-            
-            retrieved = manager.get_session(session_id)
-            
-            assert retrieved is not None
-            assert retrieved.session_id == session_id
+        original = manager.create_session("Test")
+        session_id = original.session_id
+        
+        retrieved = manager.get_session(session_id)
+        
+        assert retrieved is not None
+        assert retrieved.session_id == session_id
     
-    def test_get_session_not_found(self):
+    def test_get_session_not_found(self, manager):
         """Test retrieving non-existent session returns None."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            result = manager.get_session("nonexistent_session")
-            
-            assert result is None
+        result = manager.get_session("nonexistent_session")
+        
+        assert result is None
     
-    def test_rollback_session(self):
+    def test_rollback_session(self, manager):
         """Test rolling back a session by ID."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # Create a file and backup
-            test_file = repo_path / "test.txt"
-            test_file.write_text("Original")
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            session.backup_file(test_file)
-            session_id = session.session_id
-            
-            # Modify file
-            test_file.write_text("Modified")
-            
-            # Rollback via manager
-            result = manager.rollback_session(session_id)
-            
-            assert result is True
-            assert test_file.read_text() == "Original"
+        repo_path = manager.repo_path
+        
+        # Create a file and backup
+        test_file = repo_path / "test.txt"
+        test_file.write_text("Original")
+        
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        session_id = session.session_id
+        
+        # Modify file
+        test_file.write_text("Modified")
+        
+        # Rollback via manager
+        result = manager.rollback_session(session_id)
+        
+        assert result is True
+        assert test_file.read_text() == "Original"
     
-    def test_rollback_session_not_found(self):
+    def test_rollback_session_not_found(self, manager):
         """Test rolling back non-existent session fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            result = manager.rollback_session("nonexistent")
-            
-            assert result is False
+        result = manager.rollback_session("nonexistent")
+        
+        assert result is False
     
-    def test_rollback_already_rolled_back(self):
+    def test_rollback_already_rolled_back(self, manager):
         """Test rolling back already rolled back session fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            session = manager.create_session("Test")
-            session.rollback()
-            
-            result = manager.rollback_session(session.session_id)
-            
-            assert result is False
+        session = manager.create_session("Test")
+        session.rollback()
+        
+        result = manager.rollback_session(session.session_id)
+        
+        assert result is False
     
-    def test_cleanup_old_sessions(self):
+    def test_cleanup_old_sessions(self, manager):
         """Test cleaning up old sessions."""
         import time
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            # Create multiple sessions with different timestamps
-            sessions_created = []
-            for i in range(7):
-                # Use unique session IDs to avoid timestamp collision
-                session_id = f"session_{i:02d}"
-                session_dir = manager.backup_root / session_id
-                session_dir.mkdir(parents=True, exist_ok=True)
-                
-                manifest = BackupManifest(
-                    session_id=session_id,
-                    created_at=f"2024-01-0{i+1}T00:00:00",
-                    repo_path=str(repo_path),
-                    description=f"Session {i}",
-                )
-                manifest.completed = True
-                
-                manifest_path = session_dir / "manifest.json"
-                with open(manifest_path, "w") as f:
-                    json.dump(manifest.to_dict(), f)
-                
-                sessions_created.append(session_id)
-            
-            # Verify we have 7 sessions
-            assert len(manager.list_sessions()) == 7
-            
-            # Cleanup, keeping only 3
-            removed = manager.cleanup_old_sessions(keep_count=3)
-            
-            assert removed == 4
-            remaining = manager.list_sessions()
-            assert len(remaining) == 3
+        repo_path = manager.repo_path
+        
+        # Create multiple sessions with different timestamps
+        sessions_created = []
+        for i in range(7):
+            # Use unique session IDs to avoid timestamp collision
+            session_id = f"session_{i:02d}"
+            session_dir = manager.backup_root / session_id
+            session_dir.mkdir(parents=True, exist_ok=True)
+            
+            manifest = BackupManifest(
+                session_id=session_id,
+                created_at=f"2024-01-0{i+1}T00:00:00",
+                repo_path=str(repo_path),
+                description=f"Session {i}",
+            )
+            manifest.completed = True
+            
+            manifest_path = session_dir / "manifest.json"
+            with open(manifest_path, "w") as f:
+                json.dump(manifest.to_dict(), f)
+            
+            sessions_created.append(session_id)
+        
+        # Verify we have 7 sessions
+        assert len(manager.list_sessions()) == 7
+        
+        # Cleanup, keeping only 3
+        removed = manager.cleanup_old_sessions(keep_count=3)
+        
+        assert removed == 4
+        remaining = manager.list_sessions()
+        assert len(remaining) == 3
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+    def test_cleanup_removes_nested_backups_without_following_symlinks(self, manager):
+        """Test that cleanup deletes nested backups but not symlink targets."""
+        repo_path = manager.repo_path
+        outside = repo_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        
+        nested = repo_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+        (nested / "module.py").write_text("code")
+        
+        session = manager.create_session("Old")
+        session.backup_directory(repo_path / "src")
+        (session.session_dir / "link").symlink_to(outside, target_is_directory=True)
+        
+        removed = manager.cleanup_old_sessions(keep_count=0)
+        
+        assert removed == 1
+        assert not session.session_dir.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
     
-    def test_get_backup_size_empty(self):
+    def test_get_backup_size_empty(self, manager):
         """Test getting backup size when empty."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            size = manager.get_backup_size()
-            
-            assert size == 0
+        size = manager.get_backup_size()
+        
+        assert size == 0
     
-    def test_get_backup_size_with_files(self):
+    def test_get_backup_size_with_files(self, manager):
         """Test getting backup size with backed up files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            # Create a file
-            test_file = repo_path / "test.txt"
-            test_file.write_text("Test content" * 100)
-            
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            session.backup_file(test_file)
-            
-            size = manager.get_backup_size()
-            
-            assert size > 0
+        repo_path = manager.repo_path
+        
+        # Create a file
+        test_file = repo_path / "test.txt"
+        test_file.write_text("Test content" * 100)
+        
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        
+        size = manager.get_backup_size()
+        
+        assert size > 0
+    
+    def test_get_backup_size_counts_nested_files(self, manager):
+        """Test that backup size sums every file in nested directories."""
+        repo_path = manager.repo_path
+        nested = repo_path / "a" / "b"
+        nested.mkdir(parents=True)
+        (nested / "deep.txt").write_text("x" * 50)
+        
+        session = manager.create_session("Test")
+        session.backup_directory(repo_path / "a")
+        
+        manifest_size = (session.session_dir / "manifest.json").stat().st_size
+        assert manager.get_backup_size() == 50 + manifest_size
     
-    def test_format_backup_size(self):
+    def test_format_backup_size(self, manager):
         """Test formatting backup size."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            formatted = manager.format_backup_size()
-            
-            assert "B" in formatted or "KB" in formatted or "MB" in formatted
+        formatted = manager.format_backup_size()
+        
+        assert "B" in formatted or "KB" in formatted or "MB" in formatted
 
 
 class TestEnsureGitignoreExcludesBackup:
     """Tests for ensure_gitignore_excludes_backup function."""
     
-    def test_creates_gitignore_if_missing(self):
+    def test_creates_gitignore_if_missing(self, tmp_path):
         """Test that function creates .gitignore if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            
-            result = ensure_gitignore_excludes_backup(repo_path)
-            
-            assert result is True
-            gitignore = repo_path / ".gitignore"
-            assert gitignore.exists()
-            assert ".cursor-factory-backup/" in gitignore.read_text()
+        repo_path = tmp_path
+        
+        result = ensure_gitignore_excludes_backup(repo_path)
+        
+        assert result is True
+        gitignore = repo_path / ".gitignore"
+        assert gitignore.exists()
+        assert ".cursor-factory-backup/" in gitignore.read_text()
     
-    def test_appends_to_existing_gitignore(self):
+    def test_appends_to_existing_gitignore(self, tmp_path):
         """Test that function appends to existing .gitignore."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            gitignore = repo_path / ".gitignore"
-            gitignore.write_text("*.pyc\n__pycache__/\n")
-            
-            result = ensure_gitignore_excludes_backup(repo_path)
-            
-            assert result is True
-            content = gitignore.read_text()
-            assert "*.pyc" in content
-            assert ".cursor-factory-backup/" in content
+        repo_path = tmp_path
+        gitignore = repo_path / ".gitignore"
+        gitignore.write_text("*.pyc\n__pycache__/\n")
+        
+        result = ensure_gitignore_excludes_backup(repo_path)
+        
+        assert result is True
+        content = gitignore.read_text()
+        assert "*.pyc" in content
+        assert ".cursor-factory-backup/" in content
+    
+    def test_appends_after_missing_trailing_newline(self, tmp_path):
+        """Test that the entry starts on its own line."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.pyc")
+        
+        assert ensure_gitignore_excludes_backup(tmp_path) is True
+        
+        assert gitignore.read_text() == (
+            "*.pyc\n\n# Cursor Agent Factory backup directory\n.cursor-factory-backup/\n"
+        )
     
-    def test_does_not_duplicate_entry(self):
+    def test_does_not_duplicate_entry(self, tmp_path):
         """Test that function doesn't add duplicate entries."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            gitignore = repo_path / ".gitignore"
-            gitignore.write_text(".cursor-factory-backup/\n")
-            
-            result = ensure_gitignore_excludes_backup(repo_path)
-            
-            assert result is True
-            content = gitignore.read_text()
-            assert content.count(".cursor-factory-backup") == 1
+        repo_path = tmp_path
+        gitignore = repo_path / ".gitignore"
+        gitignore.write_text(".cursor-factory-backup/\n")
+        
+        result = ensure_gitignore_excludes_backup(repo_path)
+        
+        assert result is True
+        content = gitignore.read_text()
+        assert content.count(".cursor-factory-backup") == 1
 
 
 class TestMainEntry:
     """Tests for command-line interface."""
     
-    def test_main_list_command(self, capsys):
+    def test_main_list_command(self, manager, capsys):
         """Test main with list command by importing and calling the module code."""
         # This tests the command-line interface indirectly
         # The actual main block only runs when the module is executed directly
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            session = manager.create_session("Test")
-            session.complete()
-            
-            # Verify the session was created
-            sessions = manager.list_sessions()
-            assert len(sessions) == 1
+        session = manager.create_session("Test")
+        session.complete()
+        
+        # Verify the session was created
+        sessions = manager.list_sessions()
+        assert len(sessions) == 1
     
-    def test_main_size_command(self):
+    def test_main_size_command(self, manager):
         """Test backup size calculation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            # Initially 0
-            size = manager.get_backup_size()
-            assert size == 0
-            
-            # Create a session with a file
-            test_file = repo_path / "test.txt"
-            test_file.write_text("content")
-            session = manager.create_session("Test")
-            session.backup_file(test_file)
-            
-            # Now should have size > 0
-            size = manager.get_backup_size()
-            assert size > 0
+        repo_path = manager.repo_path
+        
+        # Initially 0
+        size = manager.get_backup_size()
+        assert size == 0
+        
+        # Create a session with a file
+        test_file = repo_path / "test.txt"
+        test_file.write_text("content")
+        session = manager.create_session("Test")
+        session.backup_file(test_file)
+        
+        # Now should have size > 0
+        size = manager.get_backup_size()
+        assert size > 0
     
-    def test_format_backup_size_units(self):
+    def test_format_backup_size_units(self, manager):
         """Test format_backup_size with various sizes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            manager = BackupManager(repo_path)
-            
-            # Empty returns "0.0 B"
-            formatted = manager.format_backup_size()
-            assert "B" in formatted or "0" in formatted
+        # Empty returns "0.0 B"
+        formatted = manager.format_backup_size()
+        assert "B" in formatted or "0" in formatted
+    
+    @pytest.mark.parametrize("size,expected", [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024 ** 2, "1.0 MB"),
+        (5 * 1024 ** 3, "5.0 GB"),
+        (1024 ** 5, "1024.0 TB"),
+    ])
+    def test_format_backup_size_boundaries(self, manager, size, expected):
+        """Test unit selection at the 1024 boundaries."""
+        with patch.object(manager, "get_backup_size", return_value=size):
+            assert manager.format_backup_size() == expected
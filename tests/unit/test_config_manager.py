@@ -12,36 +12,47 @@ Version: 1.0.0
 """
 
 import json
-import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-import tempfile
-import shutil
-
-# Import the module under test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
+# Import the module under test (tests/conftest.py puts scripts/ on sys.path)
 from config_manager import ConfigManager, KnowledgeEvolutionConfig
 
 
-@pytest.fixture
-def temp_factory_root():
-    """Create a temporary factory root directory."""
-    temp_dir = tempfile.mkdtemp()
+@pytest.fixture(autouse=True)
+def no_disk_writes(request, monkeypatch):
+    """Keep settings in memory unless a test is marked real_io.
     
+    Only initialization and migration tests need settings.json on disk;
+    everything else asserts on the in-memory settings.
+    """
+    if request.node.get_closest_marker("real_io") is None:
+        monkeypatch.setattr(ConfigManager, "_save_settings", lambda self: None)
+
+
+def _make_factory_root(root: Path) -> Path:
+    """Create the minimal factory layout inside a directory."""
     # Create required directory structure
-    cursor_config = Path(temp_dir) / ".cursor" / "config"
+    cursor_config = root / ".cursor" / "config"
     cursor_config.mkdir(parents=True)
     
     # Create a minimal .cursorrules to identify as factory root
-    (Path(temp_dir) / ".cursorrules").touch()
-    
-    yield Path(temp_dir)
+    (root / ".cursorrules").touch()
     
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return root
+
+
+@pytest.fixture
+def temp_factory_root(tmp_path):
+    """Create a temporary factory root directory."""
+    return _make_factory_root(tmp_path)
+
+
+@pytest.fixture
+def settings_path(temp_factory_root):
+    """Location of settings.json inside the temporary factory root."""
+    return temp_factory_root / ".cursor" / "config" / "settings.json"
 
 
 @pytest.fixture
@@ -58,21 +69,32 @@ def config_manager(temp_factory_root):
     ConfigManager.reset_instance()
 
 
+@pytest.fixture
+def trusting_config_manager(temp_factory_root):
+    """ConfigManager that treats every tool path as existing."""
+    return ConfigManager(factory_root=temp_factory_root, path_exists=lambda path: True)
+
+
+@pytest.fixture(scope="module")
+def ro_config_manager(tmp_path_factory):
+    """Shared ConfigManager for tests that only read settings.
+    
+    Built once per module, bypassing the singleton. Tests using it must
+    not call set() or otherwise modify its settings.
+    """
+    return ConfigManager(factory_root=_make_factory_root(tmp_path_factory.mktemp("factory")))
+
+
 class TestConfigManagerInitialization:
     """Tests for ConfigManager initialization."""
     
-    def test_creates_default_settings(self, config_manager, temp_factory_root):
+    @pytest.mark.real_io
+    def test_creates_default_settings(self, config_manager, settings_path):
         """Test that default settings are created when none exist."""
-        settings_path = temp_factory_root / ".cursor" / "config" / "settings.json"
-        
-        assert settings_path.exists()
-        
-        with open(settings_path) as f:
-            settings = json.load(f)
+        # Reading fails with FileNotFoundError if the file was not written
+        settings = json.loads(settings_path.read_text(encoding="utf-8"))
         
-        assert "system" in settings
-        assert "tools" in settings
-        assert "knowledge_evolution" in settings
+        assert {"system", "tools", "knowledge_evolution"} <= settings.keys()
     
     def test_singleton_pattern(self, temp_factory_root):
         """Test that ConfigManager follows singleton pattern."""
@@ -89,30 +111,30 @@ class TestConfigManagerInitialization:
         """Test that factory root is correctly detected."""
         assert config_manager.factory_root == temp_factory_root
     
-    def test_platform_detection(self, config_manager):
+    def test_platform_detection(self, ro_config_manager):
         """Test that platform is detected."""
-        assert config_manager.current_platform in ["windows", "linux", "darwin"]
+        assert ro_config_manager.current_platform in ["windows", "linux", "darwin"]
 
 
 class TestConfigManagerGetSet:
     """Tests for get/set operations."""
     
-    def test_get_simple_value(self, config_manager):
+    def test_get_simple_value(self, ro_config_manager):
         """Test getting a simple configuration value."""
-        version = config_manager.get("system.factory_version")
+        version = ro_config_manager.get("system.factory_version")
         
         assert version is not None
         assert isinstance(version, str)
     
-    def test_get_nested_value(self, config_manager):
+    def test_get_nested_value(self, ro_config_manager):
         """Test getting a nested configuration value."""
-        mode = config_manager.get("knowledge_evolution.mode")
+        mode = ro_config_manager.get("knowledge_evolution.mode")
         
         assert mode == "awareness_hybrid"
     
-    def test_get_with_default(self, config_manager):
+    def test_get_with_default(self, ro_config_manager):
         """Test getting a non-existent value with default."""
-        value = config_manager.get("nonexistent.path", default="default_value")
+        value = ro_config_manager.get("nonexistent.path", default="default_value")
         
         assert value == "default_value"
     
@@ -129,119 +151,189 @@ class TestConfigManagerGetSet:
         
         value = config_manager.get("new.nested.path")
         assert value == "test_value"
+    
+    def test_set_raw_matches_set(self, config_manager):
+        """Test that set_raw accepts pre-split path components."""
+        config_manager.get_knowledge_evolution_config()
+        config_manager.set_raw(("knowledge_evolution", "mode"), "freshness_first")
+        
+        assert config_manager.get("knowledge_evolution.mode") == "freshness_first"
+        assert config_manager.get_knowledge_evolution_config().mode == "freshness_first"
 
 
 class TestEnvironmentVariableResolution:
     """Tests for environment variable resolution."""
     
-    def test_resolves_env_var(self, config_manager):
-        """Test that ${VAR} syntax is resolved."""
-        with patch.dict(os.environ, {"TEST_VAR": "test_value"}):
-            config_manager.set("test.value", "${TEST_VAR}")
-            
-            resolved = config_manager.get("test.value")
-            assert resolved == "test_value"
+    @pytest.mark.parametrize("env,raw,expected", [
+        ({"TEST_VAR": "test_value"}, "${TEST_VAR}", "test_value"),
+        ({}, "${NONEXISTENT_VAR_12345}", ""),
+        ({"USER_NAME": "testuser"}, "/home/${USER_NAME}/data", "/home/testuser/data"),
+    ], ids=["whole_value", "missing_is_empty", "embedded"])
+    def test_env_var_resolution(self, config_manager, monkeypatch, env, raw, expected):
+        """Test that ${VAR} references resolve, including missing and partial ones."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        config_manager.set("test.value", raw)
+        
+        assert config_manager.get("test.value") == expected
     
-    def test_missing_env_var_returns_empty(self, config_manager):
-        """Test that missing env vars resolve to empty string."""
-        config_manager.set("test.value", "${NONEXISTENT_VAR_12345}")
+    def test_env_var_changes_are_seen(self, config_manager, monkeypatch):
+        """Test that resolution reflects the environment at call time."""
+        config_manager.set("test.value", "${TEST_VAR}")
         
-        resolved = config_manager.get("test.value")
-        assert resolved == ""
+        monkeypatch.setenv("TEST_VAR", "first")
+        assert config_manager.get("test.value") == "first"
+        monkeypatch.setenv("TEST_VAR", "second")
+        assert config_manager.get("test.value") == "second"
     
-    def test_partial_env_var_resolution(self, config_manager):
-        """Test resolving env var in a larger string."""
-        with patch.dict(os.environ, {"USER_NAME": "testuser"}):
-            config_manager.set("test.path", "/home/${USER_NAME}/data")
-            
-            resolved = config_manager.get("test.path")
-            assert resolved == "/home/testuser/data"
+    def test_plain_string_returned_unchanged(self, ro_config_manager):
+        """Test that strings without references skip substitution."""
+        with patch.object(ConfigManager, "_ENV_VAR_PATTERN") as pattern:
+            assert ro_config_manager._resolve_env_vars("$HOME {x}") == "$HOME {x}"
+        
+        pattern.sub.assert_not_called()
 
 
 class TestToolPathResolution:
     """Tests for tool path resolution."""
     
-    def test_get_tool_path_from_env(self, config_manager):
+    def test_get_tool_path_from_env(self, trusting_config_manager, monkeypatch):
         """Test tool path resolution from environment variable."""
-        with patch.dict(os.environ, {"PYTHON_PATH": "/custom/python"}):
-            with patch.object(config_manager, "_path_exists", return_value=True):
-                path = config_manager.get_tool_path("python")
-                assert path == "/custom/python"
+        monkeypatch.setenv("PYTHON_PATH", "/custom/python")
+        
+        path = trusting_config_manager.get_tool_path("python")
+        assert path == "/custom/python"
     
-    def test_get_tool_path_from_config(self, config_manager):
+    def test_get_tool_path_from_config(self, trusting_config_manager):
         """Test tool path resolution from explicit config."""
-        config_manager.set("tools.python.path", "/explicit/python")
+        trusting_config_manager.set("tools.python.path", "/explicit/python")
         
-        with patch.object(config_manager, "_path_exists", return_value=True):
-            path = config_manager.get_tool_path("python")
-            assert path == "/explicit/python"
+        path = trusting_config_manager.get_tool_path("python")
+        assert path == "/explicit/python"
     
-    def test_get_tool_path_returns_none_for_unknown(self, config_manager):
+    def test_get_tool_path_skips_missing_env_path(self, temp_factory_root, monkeypatch):
+        """Test that an env var pointing at a missing path is ignored."""
+        monkeypatch.setenv("PYTHON_PATH", "/missing/python")
+        manager = ConfigManager(
+            factory_root=temp_factory_root,
+            path_exists=lambda path: path != "/missing/python"
+        )
+        
+        assert manager.get_tool_path("python") != "/missing/python"
+    
+    def test_get_tool_path_returns_none_for_unknown(self, ro_config_manager):
         """Test that unknown tool returns None."""
-        path = config_manager.get_tool_path("unknown_tool_xyz")
+        path = ro_config_manager.get_tool_path("unknown_tool_xyz")
         assert path is None
 
 
 class TestKnowledgeEvolutionConfig:
     """Tests for knowledge evolution configuration."""
     
-    def test_get_knowledge_evolution_config(self, config_manager):
+    def test_get_knowledge_evolution_config(self, ro_config_manager):
         """Test getting knowledge evolution configuration."""
-        ke_config = config_manager.get_knowledge_evolution_config()
+        ke_config = ro_config_manager.get_knowledge_evolution_config()
         
         assert isinstance(ke_config, KnowledgeEvolutionConfig)
         assert ke_config.mode == "awareness_hybrid"
         assert ke_config.check_on_startup is True
     
-    def test_knowledge_evolution_sources(self, config_manager):
+    def test_knowledge_evolution_sources(self, ro_config_manager):
         """Test knowledge evolution sources configuration."""
-        ke_config = config_manager.get_knowledge_evolution_config()
+        ke_config = ro_config_manager.get_knowledge_evolution_config()
         
         assert "github_trending" in ke_config.sources
         assert ke_config.sources["github_trending"] is True
+    
+    def test_knowledge_evolution_config_is_cached(self, ro_config_manager):
+        """Test that repeated calls return the same config object."""
+        first = ro_config_manager.get_knowledge_evolution_config()
+        
+        assert ro_config_manager.get_knowledge_evolution_config() is first
+    
+    def test_set_invalidates_knowledge_evolution_config(self, config_manager):
+        """Test that changing a knowledge_evolution setting rebuilds the config."""
+        assert config_manager.get_knowledge_evolution_config().mode == "awareness_hybrid"
+        
+        config_manager.set("knowledge_evolution.mode", "stability_first")
+        
+        assert config_manager.get_knowledge_evolution_config().mode == "stability_first"
 
 
 class TestCredentialManagement:
     """Tests for credential management."""
     
-    def test_get_credential_resolves_env(self, config_manager):
+    def test_get_credential_resolves_env(self, ro_config_manager, monkeypatch):
         """Test getting a credential resolves environment variable."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
-            token = config_manager.get_credential("github_token")
-            assert token == "ghp_test_token"
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token")
+        
+        token = ro_config_manager.get_credential("github_token")
+        assert token == "ghp_test_token"
     
-    def test_get_missing_credential_returns_none(self, config_manager):
+    def test_get_missing_credential_returns_none(self, ro_config_manager):
         """Test getting a missing credential returns None."""
-        token = config_manager.get_credential("nonexistent_credential")
+        token = ro_config_manager.get_credential("nonexistent_credential")
         assert token is None
 
 
 class TestSettingsValidation:
     """Tests for settings validation."""
     
-    def test_validate_valid_settings(self, config_manager):
+    def test_validate_valid_settings(self, ro_config_manager):
         """Test validating correct settings returns no errors."""
-        errors = config_manager.validate_settings()
+        errors = ro_config_manager.validate_settings()
         assert len(errors) == 0
     
-    def test_validate_invalid_mode(self, config_manager):
-        """Test that invalid mode is caught."""
-        config_manager.set("knowledge_evolution.mode", "invalid_mode")
+    @pytest.mark.parametrize("path,value", [
+        ("knowledge_evolution.mode", "invalid_mode"),
+        ("knowledge_evolution.update_channel", "invalid_channel"),
+    ])
+    def test_validate_invalid_value(self, config_manager, path, value):
+        """Test that invalid knowledge evolution values are caught."""
+        config_manager.set(path, value)
+        
+        errors = config_manager.validate_settings(fail_fast=True)
+        assert path in {e.key for e in errors}
+        assert value in str(errors[0])
+    
+    def test_validate_missing_section(self, config_manager):
+        """Test that a missing required section is reported by name."""
+        del config_manager._settings["tools"]
         
         errors = config_manager.validate_settings()
-        assert any("mode" in e for e in errors)
+        assert [e.key for e in errors] == ["tools"]
+        assert str(errors[0]) == "Missing required section: tools"
     
-    def test_validate_invalid_channel(self, config_manager):
-        """Test that invalid update channel is caught."""
+    def test_validate_fail_fast_stops_at_first_error(self, config_manager):
+        """Test that fail_fast reports only the first problem found."""
+        config_manager.set("knowledge_evolution.mode", "invalid_mode")
         config_manager.set("knowledge_evolution.update_channel", "invalid_channel")
         
-        errors = config_manager.validate_settings()
-        assert any("channel" in e for e in errors)
+        assert len(config_manager.validate_settings()) == 2
+        assert len(config_manager.validate_settings(fail_fast=True)) == 1
+
+
+class TestSettingsExportImport:
+    """Tests for exporting and importing settings files."""
+    
+    @pytest.mark.real_io
+    def test_export_import_roundtrip(self, config_manager, tmp_path):
+        """Test that exported settings import back unchanged."""
+        export_path = tmp_path / "exported.json"
+        config_manager.set("test.value", "exported")
+        
+        config_manager.export_settings(export_path)
+        config_manager.set("test.value", "changed")
+        config_manager.import_settings(export_path)
+        
+        assert config_manager.get("test.value") == "exported"
+        assert json.loads(export_path.read_text(encoding="utf-8")) == config_manager.settings
 
 
 class TestLegacyMigration:
     """Tests for migrating from legacy tools.json."""
     
+    @pytest.mark.real_io
     def test_migrates_legacy_tools(self, temp_factory_root):
         """Test migration from legacy tools.json format."""
         ConfigManager.reset_instance()
@@ -260,8 +352,7 @@ class TestLegacyMigration:
             }
         }
         
-        with open(legacy_path, "w") as f:
-            json.dump(legacy_content, f)
+        legacy_path.write_text(json.dumps(legacy_content), encoding="utf-8")
         
         # Create manager - should migrate
         manager = ConfigManager(factory_root=temp_factory_root)
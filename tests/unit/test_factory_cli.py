@@ -4,17 +4,16 @@ Unit tests for cli/factory_cli.py
 Tests the CLI interface for the Cursor Agent Factory.
 """
 
+import contextlib
+import io
 import json
 import sys
-import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import Mock
 from io import StringIO
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from cli.factory_cli import (
     get_factory_root,
     display_welcome,
@@ -33,25 +32,115 @@ from cli.factory_cli import (
     _interactive_conflict_resolver,
     main,
 )
+from scripts.generate_project import ProjectGenerator
+from scripts.merge_strategy import ArtifactType, Conflict, ConflictPrompt, ConflictResolution
+
+
+@pytest.fixture
+def mock_project_generator(monkeypatch):
+    """Replace the CLI's ProjectGenerator with a mock class.
+    
+    The mock's return_value is the generator instance the CLI builds. It is
+    specced against ProjectGenerator so calls to missing methods fail.
+    """
+    mock_gen = Mock(return_value=Mock(spec=ProjectGenerator))
+    monkeypatch.setattr('cli.factory_cli.ProjectGenerator', mock_gen)
+    return mock_gen
+
+
+def _capture_stdout(func):
+    """Run func and return everything it printed."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        func()
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def cli_factory_root():
+    """Factory root as resolved by the CLI, computed once per module."""
+    return get_factory_root()
+
+
+@pytest.fixture(scope="module")
+def blueprints_output():
+    """Output of list_blueprints(), captured once per module."""
+    return _capture_stdout(list_blueprints)
+
+
+@pytest.fixture(scope="module")
+def patterns_output():
+    """Output of list_patterns(), captured once per module."""
+    return _capture_stdout(list_patterns)
+
+
+@pytest.fixture(scope="module")
+def backup_repo(tmp_path_factory):
+    """Repository holding one completed backup session, built once per module.
+    
+    Tests using it must not roll the session back or otherwise modify it.
+    """
+    from scripts.backup_manager import BackupManager
+    repo = tmp_path_factory.mktemp("backup_repo")
+    BackupManager(repo).create_session("Test session").complete()
+    return repo
+
+
+@pytest.fixture(scope="module")
+def conflict_prompt():
+    """Agent conflict offering keep-existing (recommended) or replace.
+    
+    Shared read-only by the resolver tests; the resolver never modifies it.
+    """
+    conflict = Conflict(
+        artifact_type=ArtifactType.AGENT,
+        artifact_name="test",
+        existing_path=Path("/test"),
+        new_content="New",
+    )
+    return ConflictPrompt(
+        conflict=conflict,
+        options=[ConflictResolution.KEEP_EXISTING, ConflictResolution.REPLACE],
+        recommendation=ConflictResolution.KEEP_EXISTING,
+        reason="Test reason",
+    )
+
+
+def fake_input(monkeypatch, values):
+    """Answer successive input() prompts with values, in order."""
+    answers = iter(values)
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+
+
+def assert_contains_all(text, *needles):
+    """Assert that every needle occurs in text, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing from output: {missing}"
+
+
+def set_generate_result(mock_gen, success=True, files=(), **extra):
+    """Set the result returned by the mocked generator's generate()."""
+    mock_gen.return_value.generate.return_value = {
+        'success': success,
+        'files_created': list(files),
+        **extra,
+    }
 
 
 class TestGetFactoryRoot:
     """Tests for get_factory_root function."""
     
-    def test_returns_path(self):
+    def test_returns_path(self, cli_factory_root):
         """Test that get_factory_root returns a Path."""
-        result = get_factory_root()
-        assert isinstance(result, Path)
+        assert isinstance(cli_factory_root, Path)
     
-    def test_path_exists(self):
+    def test_path_exists(self, cli_factory_root):
         """Test that returned path exists."""
-        result = get_factory_root()
-        assert result.exists()
+        assert cli_factory_root.exists()
     
-    def test_contains_blueprints(self):
+    def test_contains_blueprints(self, cli_factory_root):
         """Test that factory root contains blueprints directory."""
-        result = get_factory_root()
-        assert (result / "blueprints").exists()
+        assert (cli_factory_root / "blueprints").exists()
 
 
 class TestDisplayWelcome:
@@ -62,8 +151,7 @@ class TestDisplayWelcome:
         display_welcome()
         captured = capsys.readouterr()
         
-        assert "Welcome" in captured.out
-        assert "Cursor Agent Factory" in captured.out
+        assert_contains_all(captured.out, "Welcome", "Cursor Agent Factory")
 
 
 class TestDisplayTour:
@@ -74,10 +162,7 @@ class TestDisplayTour:
         display_tour("/test/output", 42)
         captured = capsys.readouterr()
         
-        assert "Congratulations" in captured.out
-        assert "42 files" in captured.out
-        assert "/test/output" in captured.out
-        assert ".cursorrules" in captured.out
+        assert_contains_all(captured.out, "Congratulations", "42 files", "/test/output", ".cursorrules")
 
 
 class TestDisplayErrorWithHelp:
@@ -88,426 +173,267 @@ class TestDisplayErrorWithHelp:
         display_error_with_help("Something broke", "Try this fix")
         captured = capsys.readouterr()
         
-        assert "Something broke" in captured.out
-        assert "Try this fix" in captured.out
-        assert "don't worry" in captured.out
+        assert_contains_all(captured.out, "Something broke", "Try this fix", "don't worry")
 
 
 class TestListBlueprints:
     """Tests for list_blueprints function."""
     
-    def test_lists_available_blueprints(self, capsys):
+    def test_lists_available_blueprints(self, blueprints_output):
         """Test that blueprints are listed."""
-        list_blueprints()
-        captured = capsys.readouterr()
-        
-        assert "Available Blueprints" in captured.out
-        assert "python-fastapi" in captured.out or "Blueprint" in captured.out
+        assert "Available Blueprints" in blueprints_output
+        assert "python-fastapi" in blueprints_output or "Blueprint" in blueprints_output
     
-    def test_shows_blueprint_details(self, capsys):
+    def test_shows_blueprint_details(self, blueprints_output):
         """Test that blueprint details are shown."""
-        list_blueprints()
-        captured = capsys.readouterr()
-        
-        assert "Name:" in captured.out or "Description:" in captured.out
+        assert "Name:" in blueprints_output or "Description:" in blueprints_output
 
 
 class TestListPatterns:
     """Tests for list_patterns function."""
     
-    def test_lists_available_patterns(self, capsys):
+    def test_lists_available_patterns(self, patterns_output):
         """Test that patterns are listed."""
-        list_patterns()
-        captured = capsys.readouterr()
-        
-        assert "Available Patterns" in captured.out
+        assert "Available Patterns" in patterns_output
     
-    def test_shows_pattern_categories(self, capsys):
+    def test_shows_pattern_categories(self, patterns_output):
         """Test that pattern categories are shown."""
-        list_patterns()
-        captured = capsys.readouterr()
-        
-        assert "AGENTS:" in captured.out or "SKILLS:" in captured.out
+        assert "AGENTS:" in patterns_output or "SKILLS:" in patterns_output
 
 
 class TestRunQuickstart:
     """Tests for run_quickstart function."""
     
-    def test_quickstart_with_default_output(self, capsys):
-        """Test quickstart with default output directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "quickstart-demo"
-            
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': ['file1.py', 'file2.py'],
-                }
-                mock_gen.return_value = mock_instance
-                
-                run_quickstart(str(output_dir))
-                
-                captured = capsys.readouterr()
-                assert "Welcome" in captured.out
-    
-    def test_quickstart_with_custom_blueprint(self, capsys):
-        """Test quickstart with custom blueprint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': [],
-                }
-                mock_gen.return_value = mock_instance
-                
-                run_quickstart(tmpdir, blueprint_id="typescript-react")
-                
-                captured = capsys.readouterr()
-                assert "typescript-react" in captured.out
-    
-    def test_quickstart_handles_generation_failure(self, capsys):
-        """Test quickstart handles generation failure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': False,
-                    'errors': ['Test error'],
-                }
-                mock_gen.return_value = mock_instance
-                
-                with pytest.raises(SystemExit) as exc_info:
-                    run_quickstart(tmpdir)
-                
-                assert exc_info.value.code == 1
-    
-    def test_quickstart_handles_exception(self, capsys):
-        """Test quickstart handles exceptions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_gen.side_effect = Exception("Test exception")
-                
-                with pytest.raises(SystemExit) as exc_info:
-                    run_quickstart(tmpdir)
-                
-                assert exc_info.value.code == 1
+    @pytest.mark.parametrize("kwargs,result,expected_exit,expected_out", [
+        ({}, {'files': ['file1.py', 'file2.py']}, None, "Welcome"),
+        ({'blueprint_id': "typescript-react"}, {}, None, "typescript-react"),
+        ({}, {'success': False, 'errors': ['Test error']}, 1, "Test error"),
+        ({}, Exception("Test exception"), 1, "Test exception"),
+    ], ids=["default-output", "custom-blueprint", "generation-failure", "exception"])
+    def test_quickstart(self, capsys, mock_project_generator, tmp_path,
+                        kwargs, result, expected_exit, expected_out):
+        """Test quickstart output and exit code for each generation outcome."""
+        if isinstance(result, Exception):
+            mock_project_generator.side_effect = result
+        else:
+            set_generate_result(mock_project_generator, **result)
+        output_dir = str(tmp_path / "quickstart-demo")
+        
+        if expected_exit is None:
+            run_quickstart(output_dir, **kwargs)
+        else:
+            with pytest.raises(SystemExit) as exc_info:
+                run_quickstart(output_dir, **kwargs)
+            assert exc_info.value.code == expected_exit
+        
+        captured = capsys.readouterr()
+        assert expected_out in captured.out
+
+
+# Answers to every interactive_mode prompt, in order, ending with confirmation.
+BASE_INPUTS = [
+    "test-project",         # Project name
+    "A test project",       # Description
+    "web",                  # Domain
+    "",                     # Team context
+    "python",               # Language
+    "fastapi",              # Frameworks
+    "manual",               # Triggers
+    "code-reviewer",        # Agents
+    "tdd,bugfix-workflow",  # Skills
+    "n",                    # PM enabled
+    "1",                    # MCP starter pack
+    "n",                    # Custom servers
+    "y",                    # Confirm
+]
+_PM_ENABLED_INDEX = 9
+CANCEL_INPUTS = BASE_INPUTS[:-1] + ["n"]
+PM_INPUTS = (
+    BASE_INPUTS[:_PM_ENABLED_INDEX]
+    + ["y", "github", "github-wiki", "scrum"]  # Enable PM, backend, doc backend, methodology
+    + BASE_INPUTS[_PM_ENABLED_INDEX + 1:]
+)
 
 
 class TestInteractiveMode:
     """Tests for interactive_mode function."""
     
-    def test_interactive_mode_basic_flow(self, capsys):
-        """Test basic interactive mode flow."""
-        inputs = [
-            "test-project",      # Project name
-            "A test project",    # Description
-            "web",               # Domain
-            "",                  # Team context
-            "python",            # Language
-            "fastapi",           # Frameworks
-            "manual",            # Triggers
-            "code-reviewer",     # Agents
-            "tdd,bugfix-workflow",  # Skills
-            "n",                 # PM enabled
-            "1",                 # MCP starter pack
-            "n",                 # Custom servers
-            "y",                 # Confirm
-        ]
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('builtins.input', side_effect=inputs):
-                with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                    mock_instance = MagicMock()
-                    mock_instance.generate.return_value = {
-                        'success': True,
-                        'files_created': ['file1'],
-                        'target_dir': tmpdir,
-                    }
-                    mock_gen.return_value = mock_instance
-                    
-                    interactive_mode(tmpdir)
-                    
-                    captured = capsys.readouterr()
-                    assert "Project Context" in captured.out
-    
-    def test_interactive_mode_cancel(self, capsys):
-        """Test cancelling interactive mode."""
-        inputs = [
-            "test-project",
-            "Description",
-            "web",
-            "",
-            "python",
-            "",
-            "",
-            "",
-            "",
-            "n",
-            "1",
-            "n",
-            "n",  # Don't confirm
-        ]
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('builtins.input', side_effect=inputs):
-                interactive_mode(tmpdir)
-                
-                captured = capsys.readouterr()
-                assert "Cancelled" in captured.out
-    
-    def test_interactive_mode_with_pm_enabled(self, capsys):
-        """Test interactive mode with PM system enabled."""
-        inputs = [
-            "test-project",
-            "Description",
-            "web",
-            "",
-            "python",
-            "fastapi",
-            "jira",
-            "code-reviewer",
-            "tdd",
-            "y",          # Enable PM
-            "github",     # PM backend
-            "github-wiki",  # Doc backend
-            "scrum",      # Methodology
-            "1",          # MCP pack
-            "n",          # No custom
-            "y",          # Confirm
-        ]
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('builtins.input', side_effect=inputs):
-                with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                    mock_instance = MagicMock()
-                    mock_instance.generate.return_value = {
-                        'success': True,
-                        'files_created': [],
-                        'target_dir': tmpdir,
-                    }
-                    mock_gen.return_value = mock_instance
-                    
-                    interactive_mode(tmpdir)
+    @pytest.mark.parametrize("inputs,expected_out,should_generate", [
+        (BASE_INPUTS, "Project Context", True),
+        (CANCEL_INPUTS, "Cancelled", False),
+        (PM_INPUTS, "PM system enabled: github + scrum", True),
+    ], ids=["basic-flow", "cancel", "pm-enabled"])
+    def test_interactive_flow(self, capsys, monkeypatch, mock_project_generator, tmp_path,
+                              inputs, expected_out, should_generate):
+        """Test the interactive flow for each set of answers."""
+        tmpdir = str(tmp_path)
+        set_generate_result(mock_project_generator, files=['file1'], target_dir=tmpdir)
+        fake_input(monkeypatch, inputs)
+        
+        interactive_mode(tmpdir)
+        
+        captured = capsys.readouterr()
+        assert expected_out in captured.out
+        assert mock_project_generator.called == should_generate
 
 
 class TestGenerateFromBlueprint:
     """Tests for generate_from_blueprint function."""
     
-    def test_generate_from_valid_blueprint(self, capsys):
+    def test_generate_from_valid_blueprint(self, capsys, mock_project_generator, tmp_path):
         """Test generating from a valid blueprint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': ['file1', 'file2'],
-                    'target_dir': tmpdir,
-                }
-                mock_gen.return_value = mock_instance
-                
-                generate_from_blueprint("python-fastapi", tmpdir)
-                
-                captured = capsys.readouterr()
-                assert "SUCCESS" in captured.out
-    
-    def test_generate_from_invalid_blueprint(self, capsys):
+        tmpdir = str(tmp_path)
+        set_generate_result(mock_project_generator, files=['file1', 'file2'], target_dir=tmpdir)
+        
+        generate_from_blueprint("python-fastapi", tmpdir)
+        
+        captured = capsys.readouterr()
+        assert "SUCCESS" in captured.out
+    
+    def test_generate_from_invalid_blueprint(self, capsys, tmp_path):
         """Test generating from non-existent blueprint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(SystemExit) as exc_info:
-                generate_from_blueprint("nonexistent-blueprint", tmpdir)
-            
-            assert exc_info.value.code == 1
-            captured = capsys.readouterr()
-            assert "ERROR" in captured.out
+        tmpdir = str(tmp_path)
+        with pytest.raises(SystemExit) as exc_info:
+            generate_from_blueprint("nonexistent-blueprint", tmpdir)
+        
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "ERROR" in captured.out
     
-    def test_generate_with_project_name(self, capsys):
+    def test_generate_with_project_name(self, capsys, mock_project_generator, tmp_path):
         """Test generating with custom project name."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': [],
-                    'target_dir': tmpdir,
-                }
-                mock_gen.return_value = mock_instance
-                
-                generate_from_blueprint("python-fastapi", tmpdir, project_name="my-custom-name")
-    
-    def test_generate_with_pm_enabled(self, capsys):
+        tmpdir = str(tmp_path)
+        set_generate_result(mock_project_generator, target_dir=tmpdir)
+        
+        generate_from_blueprint("python-fastapi", tmpdir, project_name="my-custom-name")
+    
+    def test_generate_with_pm_enabled(self, capsys, mock_project_generator, tmp_path):
         """Test generating with PM system enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': [],
-                    'target_dir': tmpdir,
-                }
-                mock_gen.return_value = mock_instance
-                
-                generate_from_blueprint(
-                    "python-fastapi",
-                    tmpdir,
-                    pm_enabled=True,
-                    pm_backend="github",
-                    pm_methodology="scrum",
-                )
-                
-                captured = capsys.readouterr()
-                assert "PM system enabled" in captured.out
+        tmpdir = str(tmp_path)
+        set_generate_result(mock_project_generator, target_dir=tmpdir)
+        
+        generate_from_blueprint(
+            "python-fastapi",
+            tmpdir,
+            pm_enabled=True,
+            pm_backend="github",
+            pm_methodology="scrum",
+        )
+        
+        captured = capsys.readouterr()
+        assert "PM system enabled" in captured.out
 
 
 class TestGenerateFromConfigFile:
     """Tests for generate_from_config_file function."""
     
-    def test_generate_from_json_config(self, capsys):
+    def test_generate_from_json_config(self, capsys, mock_project_generator, tmp_path):
         """Test generating from JSON config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config_data = {
-                "project_name": "test-project",
-                "project_description": "Test",
-                "domain": "web",
-                "primary_language": "python",
-                "frameworks": [],
-                "triggers": [],
-                "agents": [],
-                "skills": [],
-                "mcp_servers": [],
-            }
-            config_path.write_text(json.dumps(config_data))
-            
-            output_dir = Path(tmpdir) / "output"
-            
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': [],
-                    'target_dir': str(output_dir),
-                }
-                mock_gen.return_value = mock_instance
-                
-                generate_from_config_file(str(config_path), str(output_dir))
-                
-                captured = capsys.readouterr()
-                assert "SUCCESS" in captured.out
-    
-    def test_generate_from_nonexistent_config(self, capsys):
+        config_path = tmp_path / "config.json"
+        config_data = {
+            "project_name": "test-project",
+            "project_description": "Test",
+            "domain": "web",
+            "primary_language": "python",
+            "frameworks": [],
+            "triggers": [],
+            "agents": [],
+            "skills": [],
+            "mcp_servers": [],
+        }
+        config_path.write_text(json.dumps(config_data))
+        
+        output_dir = tmp_path / "output"
+        
+        set_generate_result(mock_project_generator, target_dir=str(output_dir))
+        
+        generate_from_config_file(str(config_path), str(output_dir))
+        
+        captured = capsys.readouterr()
+        assert "SUCCESS" in captured.out
+    
+    def test_generate_from_nonexistent_config(self, capsys, tmp_path):
         """Test generating from non-existent config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(SystemExit) as exc_info:
-                generate_from_config_file("/nonexistent/config.json", tmpdir)
-            
-            assert exc_info.value.code == 1
+        tmpdir = str(tmp_path)
+        with pytest.raises(SystemExit) as exc_info:
+            generate_from_config_file("/nonexistent/config.json", tmpdir)
+        
+        assert exc_info.value.code == 1
 
 
 class TestAnalyzeRepository:
     """Tests for analyze_repository function."""
     
-    def test_analyze_valid_repository(self, capsys):
+    def test_analyze_valid_repository(self, capsys, tmp_path):
         """Test analyzing a valid repository."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            analyze_repository(tmpdir)
-            
-            captured = capsys.readouterr()
-            assert "Analyzing repository" in captured.out
+        tmpdir = str(tmp_path)
+        analyze_repository(tmpdir)
+        
+        captured = capsys.readouterr()
+        assert "Analyzing repository" in captured.out
     
-    def test_analyze_with_artifacts(self, capsys):
+    def test_analyze_with_artifacts(self, capsys, tmp_path):
         """Test analyzing repository with existing artifacts."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            (repo_path / ".cursorrules").write_text("# Rules")
-            
-            analyze_repository(tmpdir)
-            
-            captured = capsys.readouterr()
-            assert "Analyzing" in captured.out
+        (tmp_path / ".cursorrules").write_text("# Rules")
+        
+        analyze_repository(str(tmp_path))
+        
+        captured = capsys.readouterr()
+        assert "Analyzing" in captured.out
 
 
 class TestOnboardRepository:
     """Tests for onboard_repository function."""
     
-    def test_onboard_fresh_repository(self, capsys):
+    def test_onboard_fresh_repository(self, capsys, mock_project_generator, tmp_path):
         """Test onboarding a fresh repository."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': ['file1'],
-                    'scenario': 'fresh',
-                    'skipped': [],
-                    'merged': [],
-                }
-                mock_gen.return_value = mock_instance
-                
-                onboard_repository(tmpdir)
-                
-                captured = capsys.readouterr()
-                assert "Onboarding" in captured.out
-    
-    def test_onboard_with_blueprint(self, capsys):
+        tmpdir = str(tmp_path)
+        set_generate_result(
+            mock_project_generator, files=['file1'], scenario='fresh', skipped=[], merged=[]
+        )
+        
+        onboard_repository(tmpdir)
+        
+        captured = capsys.readouterr()
+        assert "Onboarding" in captured.out
+    
+    def test_onboard_with_blueprint(self, capsys, mock_project_generator, tmp_path):
         """Test onboarding with specific blueprint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': [],
-                    'scenario': 'fresh',
-                    'skipped': [],
-                    'merged': [],
-                }
-                mock_gen.return_value = mock_instance
-                
-                onboard_repository(tmpdir, blueprint_id="python-fastapi")
-    
-    def test_onboard_dry_run(self, capsys):
+        tmpdir = str(tmp_path)
+        set_generate_result(mock_project_generator, scenario='fresh', skipped=[], merged=[])
+        
+        onboard_repository(tmpdir, blueprint_id="python-fastapi")
+    
+    def test_onboard_dry_run(self, capsys, mock_project_generator, tmp_path):
         """Test onboarding in dry run mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                mock_instance = MagicMock()
-                mock_instance.generate.return_value = {
-                    'success': True,
-                    'files_created': [],
-                    'scenario': 'fresh',
-                    'skipped': [],
-                    'merged': [],
-                }
-                mock_gen.return_value = mock_instance
-                
-                onboard_repository(tmpdir, dry_run=True)
-                
-                captured = capsys.readouterr()
-                assert "DRY RUN" in captured.out
+        tmpdir = str(tmp_path)
+        set_generate_result(mock_project_generator, scenario='fresh', skipped=[], merged=[])
+        
+        onboard_repository(tmpdir, dry_run=True)
+        
+        captured = capsys.readouterr()
+        assert "DRY RUN" in captured.out
 
 
 class TestRollbackSession:
     """Tests for rollback_session function."""
     
-    def test_rollback_no_sessions(self, capsys):
+    def test_rollback_no_sessions(self, capsys, tmp_path):
         """Test rollback when no sessions exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            rollback_session(tmpdir)
-            
-            captured = capsys.readouterr()
-            assert "No backup sessions" in captured.out
+        tmpdir = str(tmp_path)
+        rollback_session(tmpdir)
+        
+        captured = capsys.readouterr()
+        assert "No backup sessions" in captured.out
     
-    def test_rollback_with_sessions_quit(self, capsys):
+    def test_rollback_with_sessions_quit(self, capsys, monkeypatch, backup_repo):
         """Test rollback session list and quit."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a backup session
-            from scripts.backup_manager import BackupManager
-            manager = BackupManager(Path(tmpdir))
-            session = manager.create_session("Test session")
-            session.complete()
-            
-            with patch('builtins.input', return_value='q'):
-                rollback_session(tmpdir)
+        fake_input(monkeypatch, ['q'])
+        
+        rollback_session(str(backup_repo))
+        
+        captured = capsys.readouterr()
+        assert_contains_all(captured.out, "Description: Test session", "Status: completed")
 
 
 class TestCreateDefaultConfig:
@@ -533,129 +459,67 @@ class TestCreateDefaultConfig:
 class TestInteractiveConflictResolver:
     """Tests for _interactive_conflict_resolver function."""
     
-    def test_resolver_returns_recommendation_on_empty_input(self):
-        """Test resolver returns recommendation on empty input."""
-        from scripts.merge_strategy import Conflict, ConflictPrompt, ConflictResolution, ArtifactType
-        
-        conflict = Conflict(
-            artifact_type=ArtifactType.AGENT,
-            artifact_name="test",
-            existing_path=Path("/test"),
-            new_content="New",
-        )
-        
-        prompt = ConflictPrompt(
-            conflict=conflict,
-            options=[ConflictResolution.KEEP_EXISTING, ConflictResolution.REPLACE],
-            recommendation=ConflictResolution.KEEP_EXISTING,
-            reason="Test reason",
-        )
-        
-        with patch('builtins.input', return_value=''):
-            result = _interactive_conflict_resolver(prompt)
-            assert result == ConflictResolution.KEEP_EXISTING
-    
-    def test_resolver_returns_selected_option(self):
-        """Test resolver returns selected option."""
-        from scripts.merge_strategy import Conflict, ConflictPrompt, ConflictResolution, ArtifactType
-        
-        conflict = Conflict(
-            artifact_type=ArtifactType.AGENT,
-            artifact_name="test",
-            existing_path=Path("/test"),
-            new_content="New",
-        )
-        
-        prompt = ConflictPrompt(
-            conflict=conflict,
-            options=[ConflictResolution.KEEP_EXISTING, ConflictResolution.REPLACE],
-            recommendation=ConflictResolution.KEEP_EXISTING,
-            reason="Test reason",
-        )
+    @pytest.mark.parametrize("answer,expected", [
+        ('', ConflictResolution.KEEP_EXISTING),
+        ('2', ConflictResolution.REPLACE),
+    ], ids=["empty-input-takes-recommendation", "selected-option"])
+    def test_resolver_choice(self, monkeypatch, conflict_prompt, answer, expected):
+        """Test resolver returns the recommendation or the selected option."""
+        fake_input(monkeypatch, [answer])
         
-        with patch('builtins.input', return_value='2'):
-            result = _interactive_conflict_resolver(prompt)
-            assert result == ConflictResolution.REPLACE
+        result = _interactive_conflict_resolver(conflict_prompt)
+        assert result == expected
 
 
 class TestMain:
     """Tests for main function."""
     
-    def test_main_no_args_shows_help(self, capsys):
-        """Test main with no arguments shows help."""
-        with patch('sys.argv', ['factory_cli.py']):
-            main()
-            
-            captured = capsys.readouterr()
-            assert "usage" in captured.out.lower() or "help" in captured.out.lower() or "Examples" in captured.out
-    
-    def test_main_list_blueprints(self, capsys):
-        """Test main with --list-blueprints."""
-        with patch('sys.argv', ['factory_cli.py', '--list-blueprints']):
-            main()
-            
-            captured = capsys.readouterr()
-            assert "Available Blueprints" in captured.out
-    
-    def test_main_list_patterns(self, capsys):
-        """Test main with --list-patterns."""
-        with patch('sys.argv', ['factory_cli.py', '--list-patterns']):
+    @pytest.mark.parametrize("argv,expected_out,expected_exit", [
+        ([], "usage", None),
+        (['--list-blueprints'], "Available Blueprints", None),
+        (['--list-patterns'], "Available Patterns", None),
+        (['--blueprint', 'python-fastapi'], "--output is required", 1),
+        # argparse exits with 0 for --version
+        (['--version'], "Cursor Agent Factory", 0),
+    ], ids=["no-args", "list-blueprints", "list-patterns", "blueprint-without-output", "version"])
+    def test_main_variants(self, capsys, monkeypatch, argv, expected_out, expected_exit):
+        """Test main output and exit code for argument-only invocations."""
+        monkeypatch.setattr(sys, 'argv', ['factory_cli.py', *argv])
+        
+        if expected_exit is None:
             main()
-            
-            captured = capsys.readouterr()
-            assert "Available Patterns" in captured.out
+        else:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+            assert exc_info.value.code == expected_exit
+        
+        captured = capsys.readouterr()
+        assert expected_out in captured.out
     
-    def test_main_analyze(self, capsys):
+    def test_main_analyze(self, capsys, monkeypatch, tmp_path):
         """Test main with --analyze."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('sys.argv', ['factory_cli.py', '--analyze', tmpdir]):
-                main()
-                
-                captured = capsys.readouterr()
-                assert "Analyzing" in captured.out
+        monkeypatch.setattr(sys, 'argv', ['factory_cli.py', '--analyze', str(tmp_path)])
+        
+        main()
+        
+        captured = capsys.readouterr()
+        assert "Analyzing" in captured.out
     
-    def test_main_quickstart(self, capsys):
+    def test_main_quickstart(self, monkeypatch, mock_project_generator, tmp_path):
         """Test main with --quickstart."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('sys.argv', ['factory_cli.py', '--quickstart', '--quickstart-output', tmpdir]):
-                with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                    mock_instance = MagicMock()
-                    mock_instance.generate.return_value = {
-                        'success': True,
-                        'files_created': ['file1'],
-                    }
-                    mock_gen.return_value = mock_instance
-                    
-                    main()
-    
-    def test_main_blueprint_without_output_fails(self, capsys):
-        """Test main with --blueprint but no --output fails."""
-        with patch('sys.argv', ['factory_cli.py', '--blueprint', 'python-fastapi']):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            
-            assert exc_info.value.code == 1
+        monkeypatch.setattr(
+            sys, 'argv', ['factory_cli.py', '--quickstart', '--quickstart-output', str(tmp_path)]
+        )
+        set_generate_result(mock_project_generator, files=['file1'])
+        
+        main()
     
-    def test_main_blueprint_with_output(self, capsys):
+    def test_main_blueprint_with_output(self, monkeypatch, mock_project_generator, tmp_path):
         """Test main with --blueprint and --output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('sys.argv', ['factory_cli.py', '--blueprint', 'python-fastapi', '--output', tmpdir]):
-                with patch('cli.factory_cli.ProjectGenerator') as mock_gen:
-                    mock_instance = MagicMock()
-                    mock_instance.generate.return_value = {
-                        'success': True,
-                        'files_created': [],
-                        'target_dir': tmpdir,
-                    }
-                    mock_gen.return_value = mock_instance
-                    
-                    main()
-    
-    def test_main_version(self, capsys):
-        """Test main with --version."""
-        with patch('sys.argv', ['factory_cli.py', '--version']):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            
-            # argparse exits with 0 for --version
-            assert exc_info.value.code == 0
+        tmpdir = str(tmp_path)
+        monkeypatch.setattr(
+            sys, 'argv', ['factory_cli.py', '--blueprint', 'python-fastapi', '--output', tmpdir]
+        )
+        set_generate_result(mock_project_generator, target_dir=tmpdir)
+        
+        main()
@@ -4,14 +4,10 @@ Unit tests for gap types and enums in scripts/knowledge_gap_analyzer.py
 Tests for GapType and GapPriority enumerations.
 """
 
-import sys
-from pathlib import Path
+import itertools
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.knowledge_gap_analyzer import GapType, GapPriority
 
 
@@ -25,18 +21,17 @@ class TestGapType:
         
         assert expected_types == actual_types
     
-    def test_gap_type_values(self):
-        """Test gap type string values."""
-        assert GapType.MISSING.value == "missing"
-        assert GapType.SHALLOW.value == "shallow"
-        assert GapType.STALE.value == "stale"
-        assert GapType.CROSS_REF.value == "cross_reference"
-        assert GapType.INCOMPLETE.value == "incomplete"
-    
-    def test_gap_type_from_value(self):
-        """Test creating GapType from value."""
-        assert GapType("missing") == GapType.MISSING
-        assert GapType("shallow") == GapType.SHALLOW
+    @pytest.mark.parametrize("member,value", [
+        (GapType.MISSING, "missing"),
+        (GapType.SHALLOW, "shallow"),
+        (GapType.STALE, "stale"),
+        (GapType.CROSS_REF, "cross_reference"),
+        (GapType.INCOMPLETE, "incomplete"),
+    ])
+    def test_gap_type_value(self, member, value):
+        """Test gap type string values and lookup by value."""
+        assert member.value == value
+        assert GapType(value) is member
     
     def test_gap_type_invalid_value(self):
         """Test that invalid value raises error."""
@@ -61,18 +56,23 @@ class TestGapPriority:
         
         assert expected == actual
     
-    def test_priority_values(self):
-        """Test priority numeric values."""
-        assert GapPriority.CRITICAL.value == 1
-        assert GapPriority.HIGH.value == 2
-        assert GapPriority.MEDIUM.value == 3
-        assert GapPriority.LOW.value == 4
+    @pytest.mark.parametrize("member,value", [
+        (GapPriority.CRITICAL, 1),
+        (GapPriority.HIGH, 2),
+        (GapPriority.MEDIUM, 3),
+        (GapPriority.LOW, 4),
+    ])
+    def test_priority_value(self, member, value):
+        """Test priority numeric values and lookup by value."""
+        assert member.value == value
+        assert GapPriority(value) is member
     
-    def test_priority_ordering(self):
-        """Test that priorities can be compared."""
-        assert GapPriority.CRITICAL.value < GapPriority.HIGH.value
-        assert GapPriority.HIGH.value < GapPriority.MEDIUM.value
-        assert GapPriority.MEDIUM.value < GapPriority.LOW.value
+    @pytest.mark.parametrize("higher,lower", list(itertools.pairwise([
+        GapPriority.CRITICAL, GapPriority.HIGH, GapPriority.MEDIUM, GapPriority.LOW,
+    ])))
+    def test_priority_ordering(self, higher, lower):
+        """Test that more urgent priorities have smaller values."""
+        assert higher.value < lower.value
     
     def test_priority_sorting(self):
         """Test sorting priorities by value."""
@@ -82,8 +82,3 @@ class TestGapPriority:
         assert sorted_priorities[0] == GapPriority.CRITICAL
         assert sorted_priorities[1] == GapPriority.HIGH
         assert sorted_priorities[2] == GapPriority.LOW
-    
-    def test_priority_from_value(self):
-        """Test creating GapPriority from value."""
-        assert GapPriority(1) == GapPriority.CRITICAL
-        assert GapPriority(4) == GapPriority.LOW
@@ -6,11 +6,6 @@ potentially harmful operations according to the core axioms.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add scripts directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from guardian.axiom_checker import (
     check_command,
@@ -46,6 +41,17 @@ class TestCheckCommand:
         assert result.level == 4, f"{description} should be Level 4"
         assert result.axiom == "A4", f"{description} violates A4 (Non-Harm)"
 
+    @pytest.mark.parametrize("command", [
+        "Rm -Rf /",
+        "drop database production",
+        "Truncate Table orders",
+        "SHUTDOWN",
+    ])
+    def test_level_4_ignores_case(self, command):
+        """Critical commands are caught regardless of letter case."""
+        result = check_command(command)
+        assert result.level == 4, f"'{command}' should be Level 4"
+
     # Level 2-3: Caution needed - ask user
     @pytest.mark.parametrize("command,expected_level", [
         ("cat .env", 2),
@@ -6,11 +6,6 @@ axiom checking, secret scanning, and content analysis.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add scripts directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from guardian.harm_detector import (
     analyze_command,
@@ -59,7 +54,8 @@ class TestAnalyzeFileOperation:
         report = analyze_file_operation("write", ".cursorrules")
         assert not report.safe
         assert report.level >= 2
-        assert "agent behavior" in str(report.details).lower() or "caution" in str(report.details).lower()
+        details_lc = str(report.details).lower()
+        assert "agent behavior" in details_lc or "caution" in details_lc
 
     def test_file_with_secrets(self):
         """File content with secrets should be flagged."""
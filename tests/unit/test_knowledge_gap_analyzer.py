@@ -5,15 +5,10 @@ Tests for CoverageScore, KnowledgeGap, AnalysisResult, and KnowledgeGapAnalyzer.
 """
 
 import json
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.knowledge_gap_analyzer import (
     CoverageScore,
     KnowledgeGap,
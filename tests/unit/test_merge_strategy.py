@@ -5,15 +5,12 @@ Tests merge strategies, conflict detection, and resolution mechanisms.
 """
 
 import json
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.merge_strategy import (
     ConflictResolution,
     ArtifactType,
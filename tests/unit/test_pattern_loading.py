@@ -9,14 +9,10 @@ Tests cover:
 """
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 class TestBlueprintFiles:
     """Tests for blueprint file loading."""
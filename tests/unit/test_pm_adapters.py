@@ -8,14 +8,9 @@ Tests cover:
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 @pytest.fixture
 def adapters_dir(factory_root):
@@ -7,14 +7,8 @@ Tests cover:
 - Agent/skill extension when PM is enabled
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.generate_project import ProjectConfig
 
 
@@ -34,49 +28,37 @@ class TestPMConfigFields:
             pytest.fail("pm_enabled field not found in ProjectConfig. "
                        "PM fields need to be added to ProjectConfig dataclass.")
     
-    def test_pm_backend_accepts_valid_values(self):
+    def test_pm_backend_accepts_valid_values(self, make_config):
         """Test that pm_backend accepts valid backend values."""
         valid_backends = ["github", "jira", "azure-devops", "linear"]
         
         for backend in valid_backends:
             if hasattr(ProjectConfig, '__annotations__') and 'pm_backend' in ProjectConfig.__annotations__:
-                config = ProjectConfig(
-                    project_name="test-project",
-                    pm_enabled=True,
-                    pm_backend=backend
-                )
+                config = make_config(pm_enabled=True, pm_backend=backend)
                 assert config.pm_backend == backend
             else:
                 # PM fields not implemented yet
                 pytest.skip("PM fields not implemented in ProjectConfig yet")
     
-    def test_pm_doc_backend_accepts_valid_values(self):
+    def test_pm_doc_backend_accepts_valid_values(self, make_config):
         """Test that pm_doc_backend accepts valid backend values."""
         valid_backends = ["github", "jira", "confluence", "azure-devops", "linear"]
         
         for backend in valid_backends:
             if hasattr(ProjectConfig, '__annotations__') and 'pm_doc_backend' in ProjectConfig.__annotations__:
-                config = ProjectConfig(
-                    project_name="test-project",
-                    pm_enabled=True,
-                    pm_doc_backend=backend
-                )
+                config = make_config(pm_enabled=True, pm_doc_backend=backend)
                 assert config.pm_doc_backend == backend
             else:
                 # PM fields not implemented yet
                 pytest.skip("PM fields not implemented in ProjectConfig yet")
     
-    def test_pm_methodology_accepts_valid_values(self):
+    def test_pm_methodology_accepts_valid_values(self, make_config):
         """Test that pm_methodology accepts valid methodology values."""
         valid_methodologies = ["scrum", "kanban", "hybrid", "waterfall"]
         
         for methodology in valid_methodologies:
             if hasattr(ProjectConfig, '__annotations__') and 'pm_methodology' in ProjectConfig.__annotations__:
-                config = ProjectConfig(
-                    project_name="test-project",
-                    pm_enabled=True,
-                    pm_methodology=methodology
-                )
+                config = make_config(pm_enabled=True, pm_methodology=methodology)
                 assert config.pm_methodology == methodology
             else:
                 # PM fields not implemented yet
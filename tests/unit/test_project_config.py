@@ -10,15 +10,10 @@ Tests cover:
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 import yaml
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.generate_project import ProjectConfig
 
 
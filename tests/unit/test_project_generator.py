@@ -9,13 +9,9 @@ Tests cover:
 - File writing and tracking
 """
 
-import sys
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from scripts.generate_project import ProjectGenerator  # noqa: E402
+from scripts.generate_project import ProjectGenerator
 
 
 class TestProjectGeneratorInit:
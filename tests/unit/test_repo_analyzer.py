@@ -5,15 +5,12 @@ Tests repository analysis, tech stack detection, and onboarding scenarios.
 """
 
 import json
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.repo_analyzer import (
     OnboardingScenario,
     CursorruleAnalysis,
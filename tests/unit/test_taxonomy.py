@@ -5,14 +5,9 @@ Tests for TopicNode, TaxonomyLoader, and load_agent_taxonomy functionality.
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.taxonomy import TopicNode, TaxonomyLoader, load_agent_taxonomy
 
 
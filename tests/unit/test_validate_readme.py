@@ -5,15 +5,12 @@ Tests README structure validation and update functionality.
 """
 
 import json
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.validate_readme_structure import StructureValidator, main
 
 
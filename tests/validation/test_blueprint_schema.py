@@ -5,15 +5,10 @@ Tests validate that all blueprint.json files conform to expected structure.
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 from jsonschema import Draft7Validator
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 # Define blueprint schema
 BLUEPRINT_SCHEMA = {
@@ -6,14 +6,9 @@ Tests validate that extension templates and schemas are properly structured.
 
 import json
 import re
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 class TestKnowledgeTemplate:
     """Tests for knowledge file template."""
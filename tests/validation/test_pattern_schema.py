@@ -5,15 +5,11 @@ Tests validate that agent and skill patterns conform to expected structure.
 """
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 from jsonschema import Draft7Validator
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 # Define agent pattern schema
 AGENT_PATTERN_SCHEMA = {
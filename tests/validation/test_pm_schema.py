@@ -6,15 +6,11 @@ files conform to expected structure.
 """
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 from jsonschema import Draft7Validator
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 # Define PM Product schema
 PM_PRODUCT_SCHEMA = {
@@ -8,15 +8,8 @@ This ensures documentation stays synchronized with the codebase
 as the project evolves, catching drift before it reaches production.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add project root and scripts to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-
 from scripts.validate_readme_structure import StructureValidator
 
 
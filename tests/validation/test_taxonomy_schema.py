@@ -5,14 +5,9 @@ Tests validate that taxonomy JSON files conform to expected structure.
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 class TestAgentTaxonomyStructure:
     """Tests for agent taxonomy file structure."""